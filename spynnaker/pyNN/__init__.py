@@ -19,16 +19,13 @@ and implementation for the PyNN High-level API
 This package contains the profile of that code for PyNN 0.9.
 """
 # pylint: disable=invalid-name
+from __future__ import annotations
 
 # common imports
 import logging
-from typing import (
-    Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type,
-    TypedDict, Union, cast)
+from typing import TYPE_CHECKING
 
 import numpy as __numpy
-from typing_extensions import Literal
-from numpy.typing import NDArray
 
 from pyNN import common as pynn_common
 from pyNN.common import control as _pynn_control
@@ -145,6 +142,13 @@ from spynnaker._version import __version_name__  # NOQA
 from spynnaker._version import __version_month__  # NOQA
 from spynnaker._version import __version_year__  # NOQA
 
+if TYPE_CHECKING:
+    from typing import (
+        Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple,
+        Type, Union)
+    from typing_extensions import Literal
+    from numpy.typing import NDArray
+
 
 #: The timestep to use of "auto" is specified as a timestep
 SPYNNAKER_AUTO_TIMESTEP = 1.0
@@ -194,41 +198,58 @@ __all__ = [
     'record', "get_machine"]
 
 
-class __PynnOperations(TypedDict, total=False):
-    run: Callable[[float, Any], float]
-    run_until: Callable[[float, Any], float]
-    get_current_time: Callable[[], float]
-    get_time_step: Callable[[], float]
-    get_max_delay: Callable[[], int]
-    get_min_delay: Callable[[], int]
-    num_processes: Callable[[], int]
-    rank: Callable[[], int]
-    reset: Callable[[Dict[str, Any]], None]
-    create: Callable[
-        [Union[Type, AbstractPyNNModel], Optional[Dict[str, Any]], int],
-        Population]
-    connect: Callable[
-        [Population, Population, float, Optional[float], Optional[str], int,
-         Optional[NumpyRNG]], None]
-    record: Callable[
-        [Union[str, Sequence[str]], PopulationBase, str, Optional[float],
-         Optional[Dict[str, Any]]], Block]
-
-
-# Dynamically-extracted operations from PyNN
-__pynn: __PynnOperations = {}
+def __pynn_not_setup(*_args: Any, **_kwargs: Any) -> Any:
+    """
+    Stands in for the PyNN operations until setup has been called.
+
+    :raises ~spinn_utilities.exceptions.SimulatorNotSetupException: Always
+    """
+    raise SimulatorNotSetupException(
+        "This call is not supported before setup has been called")
+
+
+# Operations extracted from PyNN; replaced when setup is called
+__pynn_run: Callable[[float, Any], float] = __pynn_not_setup
+__pynn_run_until: Callable[[float, Any], float] = __pynn_not_setup
+__pynn_get_current_time: Callable[[], float] = __pynn_not_setup
+__pynn_get_time_step: Callable[[], float] = __pynn_not_setup
+__pynn_get_min_delay: Callable[[], int] = __pynn_not_setup
+__pynn_num_processes: Callable[[], int] = __pynn_not_setup
+__pynn_rank: Callable[[], int] = __pynn_not_setup
+__pynn_reset: Callable[[Dict[str, Any]], None] = __pynn_not_setup
+__pynn_create: Callable[
+    [Union[Type, AbstractPyNNModel], Optional[Dict[str, Any]], int],
+    Population] = __pynn_not_setup
+__pynn_connect: Callable[
+    [Population, Population, float, Optional[float], Optional[str], int,
+     Optional[NumpyRNG]], None] = __pynn_not_setup
+__pynn_record: Callable[
+    [Union[str, Sequence[str]], PopulationBase, str, Optional[float],
+     Optional[Dict[str, Any]]], Block] = __pynn_not_setup
+
 # Cache of the simulator created by setup
 __simulator: Optional[SpiNNaker] = None
+# Whether the user was last seen to be able to act; this is only trusted
+# until something that could change the run state is called.
+__user_can_act = False
+# Cache of the names found by list_standard_models
+__standard_models: Optional[List[str]] = None
 
 
 # Patch the bugs in the PyNN documentation... Ugh!
-def distance(src_cell: IDMixin, tgt_cell: IDMixin,
+def distance(src_cell: Union[IDMixin, Sequence[IDMixin], NDArray],
+             tgt_cell: Union[IDMixin, Sequence[IDMixin], NDArray],
              mask: Optional[NDArray] = None,
              scale_factor: float = 1.0, offset: float = 0.0,
-             periodic_boundaries=None) -> float:
+             periodic_boundaries=None) -> Union[float, NDArray]:
     """
     Return the Euclidean distance between two cells.
 
+    Either cell may instead be a list of cells or an array of positions
+    (one position per row), in which case all the distances are computed
+    in one go; if both are then the result is an array with a row for
+    each source and a column for each target.
+
     :param src_cell: Measure from this cell
     :param tgt_cell: To this cell
     :param ~numpy.ndarray mask:
@@ -242,9 +263,42 @@ def distance(src_cell: IDMixin, tgt_cell: IDMixin,
         (the post-synaptic position is multiplied by this quantity).
     :param float offset:
     :param periodic_boundaries:
+    :rtype: float or ~numpy.ndarray
     """
-    return _pynn_distance(
-        src_cell, tgt_cell, mask, scale_factor, offset, periodic_boundaries)
+    if not (isinstance(src_cell, (__numpy.ndarray, list, tuple)) or
+            isinstance(tgt_cell, (__numpy.ndarray, list, tuple))):
+        return _pynn_distance(
+            src_cell, tgt_cell, mask, scale_factor, offset,
+            periodic_boundaries)
+
+    src = __positions(src_cell)
+    tgt = __positions(tgt_cell)
+    if src.ndim == 2 and tgt.ndim == 2:
+        src = src[:, None, :]
+        tgt = tgt[None, :, :]
+    d = src - scale_factor * (tgt + offset)
+    if periodic_boundaries is not None:
+        d = __numpy.abs(d)
+        d = __numpy.minimum(d, periodic_boundaries - d)
+    if mask is not None:
+        d = d[..., mask]
+    return __numpy.sqrt(__numpy.einsum("...i,...i->...", d, d))
+
+
+def __positions(
+        cells: Union[IDMixin, Sequence[IDMixin], NDArray]) -> NDArray:
+    """
+    Get the positions of one or more cells.
+
+    :param cells: A cell, a list of cells or an array of positions
+    :return: The position, or the positions one per row
+    :rtype: ~numpy.ndarray
+    """
+    if isinstance(cells, __numpy.ndarray):
+        return cells
+    if isinstance(cells, (list, tuple)):
+        return __numpy.array([cell.position for cell in cells])
+    return __numpy.asarray(cells.position)
 
 
 def setup(timestep: Optional[Union[float, Literal["auto"]]] = None,
@@ -294,11 +348,13 @@ def setup(timestep: Optional[Union[float, Literal["auto"]]] = None,
     # pylint: disable=global-statement,too-many-arguments
     # Check for "auto" values and None
     global __simulator
+    _user_state_changed()
     if timestep is None:
         logger.warning(
-            f"The default PyNN timestep of {_pynn_control.DEFAULT_TIMESTEP} "
+            "The default PyNN timestep of {} "
             "is less than 1(ms) that SpyNNaker is designed for. "
-            "Consider including a timestep in your setup call.")
+            "Consider including a timestep in your setup call.",
+            _pynn_control.DEFAULT_TIMESTEP)
         timestep = float(_pynn_control.DEFAULT_TIMESTEP)
     elif timestep == "auto":
         timestep = SPYNNAKER_AUTO_TIMESTEP
@@ -329,7 +385,7 @@ def setup(timestep: Optional[Union[float, Literal["auto"]]] = None,
         n_chips_required=n_chips_required,
         n_boards_required=n_boards_required)
     # pylint: disable=protected-access
-    external_devices._set_simulator(__simulator)
+    external_devices._set_simulator(__simulator, _user_state_changed)
 
     # warn about kwargs arguments
     if extra_params:
@@ -339,6 +395,7 @@ def setup(timestep: Optional[Union[float, Literal["auto"]]] = None,
     # get overloaded functions from PyNN in relation of our simulator object
     _create_overloaded_functions(__simulator)
     SpynnakerDataView.add_database_socket_addresses(database_socket_addresses)
+    _user_can_act()
     return rank()
 
 
@@ -391,6 +448,24 @@ def Projection(
         partition_id=partition_id)
 
 
+def _user_can_act() -> None:
+    """
+    Records that the user can make calls, so the wrappers do not need to
+    ask the data view again.
+    """
+    global __user_can_act  # pylint: disable=global-statement
+    __user_can_act = True
+
+
+def _user_state_changed() -> None:
+    """
+    Records that the run state may have changed, so the wrappers must ask
+    the data view again.
+    """
+    global __user_can_act  # pylint: disable=global-statement
+    __user_can_act = False
+
+
 def _create_overloaded_functions(spinnaker_simulator: SpiNNaker):
     """
     Creates functions that the main PyNN interface supports
@@ -398,23 +473,28 @@ def _create_overloaded_functions(spinnaker_simulator: SpiNNaker):
 
     :param spinnaker_simulator: the simulator object we use underneath
     """
+    # pylint: disable=global-statement
+    global __pynn_run, __pynn_run_until, __pynn_get_current_time
+    global __pynn_get_time_step, __pynn_get_min_delay, __pynn_num_processes
+    global __pynn_rank, __pynn_reset, __pynn_create, __pynn_connect
+    global __pynn_record
     # overload the failed ones with now valid ones, now that we're in setup
     # phase.
-    __pynn["run"], __pynn["run_until"] = pynn_common.build_run(
+    __pynn_run, __pynn_run_until = pynn_common.build_run(
         spinnaker_simulator)
 
-    __pynn["get_current_time"], __pynn["get_time_step"], \
-        __pynn["get_min_delay"], __pynn["get_max_delay"], \
-        __pynn["num_processes"], __pynn["rank"] = \
+    __pynn_get_current_time, __pynn_get_time_step, \
+        __pynn_get_min_delay, _, \
+        __pynn_num_processes, __pynn_rank = \
         pynn_common.build_state_queries(spinnaker_simulator)
 
-    __pynn["reset"] = pynn_common.build_reset(spinnaker_simulator)
-    __pynn["create"] = pynn_common.build_create(Population)
+    __pynn_reset = pynn_common.build_reset(spinnaker_simulator)
+    __pynn_create = pynn_common.build_create(Population)
 
-    __pynn["connect"] = pynn_common.build_connect(
+    __pynn_connect = pynn_common.build_connect(
         Projection, FixedProbabilityConnector, StaticSynapse)
 
-    __pynn["record"] = pynn_common.build_record(spinnaker_simulator)
+    __pynn_record = pynn_common.build_record(spinnaker_simulator)
 
 
 def end(_=True) -> None:
@@ -438,6 +518,7 @@ def end(_=True) -> None:
         io = get_io(filename)
         population.write_data(io, variables)
     __simulator.write_on_end = []
+    _user_state_changed()
     __simulator.stop()
 
 
@@ -448,10 +529,15 @@ def list_standard_models() -> List[str]:
 
     :rtype: list(str)
     """
-    return [
-        key
-        for (key, obj) in globals().items()
-        if isinstance(obj, type) and issubclass(obj, AbstractPyNNModel)]
+    # pylint: disable=global-statement
+    global __standard_models
+    if __standard_models is None:
+        __standard_models = [
+            key
+            for (key, obj) in globals().items()
+            if isinstance(obj, type) and issubclass(obj, AbstractPyNNModel)]
+    # Return a copy so the caller can not change the cached value
+    return list(__standard_models)
 
 
 def set_number_of_neurons_per_core(
@@ -483,8 +569,8 @@ def set_number_of_neurons_per_core(
         if is_singleton(max_permitted):
             max_neurons = (int(max_permitted), )
         else:
-            max_perm: Tuple[int, ...] = cast(Tuple[int, ...], max_permitted)
-            max_neurons = tuple(int(m) for m in max_perm)
+            max_neurons = tuple(
+                __numpy.asarray(max_permitted, dtype=__numpy.intp).tolist())
 
     SpynnakerDataView.set_number_of_neurons_per_dimension_per_core(
         neuron_type, max_neurons)
@@ -508,8 +594,9 @@ def connect(pre: Population, post: Population, weight: float = 0.0,
     :param ~pyNN.random.NumpyRNG rng: random number generator
     """
     # pylint: disable=too-many-arguments
-    SpynnakerDataView.check_user_can_act()
-    __pynn["connect"](pre, post, weight, delay, receptor_type, p, rng)
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    __pynn_connect(pre, post, weight, delay, receptor_type, p, rng)
 
 
 def create(
@@ -525,17 +612,23 @@ def create(
     :param int n: number of neurons
     :rtype: ~spynnaker.pyNN.models.populations.Population
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["create"](cellclass, cellparams, n)
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_create(cellclass, cellparams, n)
 
 
 def NativeRNG(seed_value: Union[int, List[int], NDArray]) -> None:
     """
     Fixes the random number generator's seed.
 
+    This seeds both the shared generator returned by
+    :py:meth:`SpynnakerDataView.get_rng` and, for backward compatibility,
+    the legacy numpy global random state.
+
     :param seed_value:
     :type seed_value: int or list(int) or ~numpy.ndarray(int32)
     """
+    SpynnakerDataView.set_rng_seed(seed_value)
     __numpy.random.seed(seed_value)
 
 
@@ -545,8 +638,9 @@ def get_current_time() -> float:
 
     :return: returns the current time
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["get_current_time"]()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_get_current_time()
 
 
 def get_min_delay() -> int:
@@ -557,8 +651,9 @@ def get_min_delay() -> int:
     :return: returns the min delay of the simulation
     :rtype: int
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["get_min_delay"]()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_get_min_delay()
 
 
 def get_max_delay() -> int:
@@ -582,8 +677,9 @@ def get_time_step() -> float:
     :return: get the time step of the simulation (in ms)
     :rtype: float
     """
-    SpynnakerDataView.check_user_can_act()
-    return float(__pynn["get_time_step"]())
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return float(__pynn_get_time_step())
 
 
 def initialize(cells: PopulationBase, **initial_values):
@@ -595,7 +691,8 @@ def initialize(cells: PopulationBase, **initial_values):
         ~spynnaker.pyNN.models.populations.PopulationView
     :param initial_values: the parameters and their values to change
     """
-    SpynnakerDataView.check_user_can_act()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
     pynn_common.initialize(cells, **initial_values)
 
 
@@ -609,8 +706,9 @@ def num_processes() -> int:
     :return: the number of MPI processes
     :rtype: int
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["num_processes"]()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_num_processes()
 
 
 def rank() -> int:
@@ -623,8 +721,9 @@ def rank() -> int:
     :return: MPI rank
     :rtype: int
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["rank"]()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_rank()
 
 
 def record(variables: Union[str, Sequence[str]], source: PopulationBase,
@@ -648,9 +747,10 @@ def record(variables: Union[str, Sequence[str]], source: PopulationBase,
     :return: neo object
     :rtype: ~neo.core.Block
     """
-    SpynnakerDataView.check_user_can_act()
-    return __pynn["record"](variables, source, filename, sampling_interval,
-                            annotations)
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    return __pynn_record(variables, source, filename, sampling_interval,
+                         annotations)
 
 
 def reset(annotations: Optional[Dict[str, Any]] = None):
@@ -662,8 +762,9 @@ def reset(annotations: Optional[Dict[str, Any]] = None):
     """
     if annotations is None:
         annotations = {}
-    SpynnakerDataView.check_user_can_act()
-    __pynn["reset"](annotations)
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
+    __pynn_reset(annotations)
 
 
 def run(simtime: float, callbacks=None) -> float:
@@ -677,7 +778,10 @@ def run(simtime: float, callbacks=None) -> float:
     :rtype: float
     """
     SpynnakerDataView.check_user_can_act()
-    return __pynn["run"](simtime, callbacks)
+    _user_state_changed()
+    run_time = __pynn_run(simtime, callbacks)
+    _user_can_act()
+    return run_time
 
 
 # left here because needs to be done, and no better place to put it
@@ -694,7 +798,10 @@ def run_until(tstop: float) -> float:
     :rtype: float
     """
     SpynnakerDataView.check_user_can_act()
-    return __pynn["run_until"](tstop, None)
+    _user_state_changed()
+    run_time = __pynn_run_until(tstop, None)
+    _user_can_act()
+    return run_time
 
 
 def get_machine() -> Machine:
@@ -704,5 +811,6 @@ def get_machine() -> Machine:
     :return: the machine object
     :rtype: ~spinn_machine.Machine
     """
-    SpynnakerDataView.check_user_can_act()
+    if not __user_can_act:
+        SpynnakerDataView.check_user_can_act()
     return SpynnakerDataView.get_machine()
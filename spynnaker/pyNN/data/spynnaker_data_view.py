@@ -14,12 +14,18 @@
 from __future__ import annotations
 import logging
 from typing import (
-    Iterator, Optional, Set, Tuple, Type, Union, TYPE_CHECKING)
+    Dict, Iterator, List, Optional, Set, Tuple, Type, Union, TYPE_CHECKING)
+import numpy
+from numpy.random import Generator
+from numpy.typing import NDArray
 from spinn_utilities.log import FormatAdapter
 from spinn_front_end_common.data import FecDataView
 from spynnaker import _version
 from spynnaker.pyNN.models.abstract_pynn_model import AbstractPyNNModel
 if TYPE_CHECKING:
+    from pacman.model.graphs.application import ApplicationVertex
+    from spynnaker.pyNN.models.neural_projections import (
+        ProjectionApplicationEdge)
     from spynnaker.pyNN.models.projection import Projection
     from spynnaker.pyNN.models.populations import Population
 
@@ -50,7 +56,9 @@ class _SpynnakerDataModel(object):
         "_min_delay",
         "_neurons_per_core_set",
         "_populations",
+        "_projection_edges",
         "_projections",
+        "_rng",
         "_segment_counter")
 
     def __new__(cls) -> '_SpynnakerDataModel':
@@ -59,6 +67,9 @@ class _SpynnakerDataModel(object):
         # pylint: disable=protected-access
         obj = object.__new__(cls)
         cls.__singleton = obj
+        # Like the numpy global seed, the random number generator is not
+        # cleared by setup, so it can be seeded before setup is called
+        obj._rng = None
         obj._clear()
         return obj
 
@@ -72,6 +83,9 @@ class _SpynnakerDataModel(object):
         self._neurons_per_core_set: Set[Type[AbstractPyNNModel]] = set()
         self._populations: Set[Population] = set()
         self._projections: Set[Projection] = set()
+        self._projection_edges: Dict[
+            Tuple[ApplicationVertex, ApplicationVertex, str],
+            ProjectionApplicationEdge] = dict()
         self._segment_counter = 0
 
     def _hard_reset(self) -> None:
@@ -178,6 +192,43 @@ class SpynnakerDataView(FecDataView):
             raise TypeError("The projection must be a Projection")
         cls.__spy_data._projections.add(projection)
 
+    @classmethod
+    def add_projection_edge(
+            cls, edge: ProjectionApplicationEdge, partition_id: str):
+        """
+        Called by a projection to add a new edge to the graph, remembering
+        it so that later projections between the same vertices can be merged
+        into it.
+
+        Usage other than from `Projection.__init__` is not supported and likely
+        to raise an exception
+
+        :param ProjectionApplicationEdge edge: The edge to add
+        :param str partition_id: The partition to add the edge to
+        """
+        cls.add_edge(edge, partition_id)
+        cls.__spy_data._projection_edges[
+            edge.pre_vertex, edge.post_vertex, partition_id] = edge
+
+    @classmethod
+    def get_projection_edge(
+            cls, pre_vertex: ApplicationVertex,
+            post_vertex: ApplicationVertex,
+            partition_id: str) -> Optional[ProjectionApplicationEdge]:
+        """
+        The edge previously added by a projection between two vertices in a
+        partition, if any.
+
+        :param ~pacman.model.graphs.application.ApplicationVertex pre_vertex:
+            The source vertex of the projections
+        :param ~pacman.model.graphs.application.ApplicationVertex post_vertex:
+            The target vertex of the projections
+        :param str partition_id: The partition of the projections
+        :rtype: ProjectionApplicationEdge or None
+        """
+        return cls.__spy_data._projection_edges.get(
+            (pre_vertex, post_vertex, partition_id))
+
     @classmethod
     def iterate_populations(cls) -> Iterator[Population]:
         """
@@ -255,6 +306,31 @@ class SpynnakerDataView(FecDataView):
         neuron_type.set_model_max_atoms_per_dimension_per_core(max_permitted)
         cls.__spy_data._neurons_per_core_set.add(neuron_type)
 
+    @classmethod
+    def get_rng(cls) -> Generator:
+        """
+        The random number generator shared by the host side code.
+
+        If no seed has been set, the generator is seeded from the operating
+        system when first requested.
+
+        :rtype: ~numpy.random.Generator
+        """
+        if cls.__spy_data._rng is None:
+            cls.__spy_data._rng = numpy.random.default_rng()
+        return cls.__spy_data._rng
+
+    @classmethod
+    def set_rng_seed(cls, seed: Optional[Union[int, List[int], NDArray]]):
+        """
+        Replaces the shared random number generator with a new one
+        created from the given seed.
+
+        :param seed: The seed, or `None` to seed from the operating system
+        :type seed: int or list(int) or ~numpy.ndarray(int) or None
+        """
+        cls.__spy_data._rng = numpy.random.default_rng(seed)
+
     @classmethod
     def get_segment_counter(cls) -> int:
         """
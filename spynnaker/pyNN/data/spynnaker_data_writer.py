@@ -43,6 +43,7 @@ class SpynnakerDataWriter(FecDataWriter, SpynnakerDataView):
     @overrides(FecDataWriter._mock)
     def _mock(self) -> None:
         FecDataWriter._mock(self)
+        self.__spy_data._clear()
         self._set_min_delay(1)
 
     @overrides(FecDataWriter._hard_reset)
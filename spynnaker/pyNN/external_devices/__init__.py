@@ -21,7 +21,7 @@ PushBot (https://spinnakermanchester.github.io/docs/push_bot/).
     accuracy to gain performance.
 """
 import os
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from spinn_utilities.socket_address import SocketAddress
 from spinnman.messages.eieio import EIEIOType
 from spinn_front_end_common.abstract_models import (
@@ -116,6 +116,8 @@ __all__ = [
 ]
 # Cache of the simulator provided by pyNN/__init__py
 __simulator: Optional[SpiNNaker] = None
+# Tells pyNN/__init__py that the run state may be about to change
+__state_changed: Optional[Callable[[], None]] = None
 
 
 def run_forever(sync_time: float = 0.0):
@@ -131,6 +133,8 @@ def run_forever(sync_time: float = 0.0):
     """
     SpynnakerDataView.check_user_can_act()
     assert __simulator is not None, "no simulator set up"
+    if __state_changed is not None:
+        __state_changed()
     __simulator.run(None, sync_time)
 
 
@@ -144,6 +148,8 @@ def run_sync(run_time: float, sync_time: float):
     """
     SpynnakerDataView.check_user_can_act()
     assert __simulator is not None, "no simulator set up"
+    if __state_changed is not None:
+        __state_changed()
     __simulator.run(run_time, sync_time)
 
 
@@ -153,6 +159,8 @@ def continue_simulation() -> None:
     """
     SpynnakerDataView.check_valid_simulator()
     assert __simulator is not None, "no simulator set up"
+    if __state_changed is not None:
+        __state_changed()
     __simulator.continue_simulation()
 
 
@@ -163,6 +171,8 @@ def request_stop() -> None:
     """
     SpynnakerDataView.check_valid_simulator()
     assert __simulator is not None, "no simulator set up"
+    if __state_changed is not None:
+        __state_changed()
     __simulator.stop_run()
 
 
@@ -360,13 +370,17 @@ def SpikeInjector(
     return ExternalDeviceSpikeInjector()
 
 
-def _set_simulator(simulator: SpiNNaker):
+def _set_simulator(simulator: SpiNNaker,
+                   state_changed: Optional[Callable[[], None]] = None):
     """
     Should only be called by pyNN/__init__py setup method.
 
     Any other uses is not supported.
 
     :param spynnaker.pyNN.spinnaker.SpiNNaker simulator:
+    :param callable state_changed:
+        Called before anything here which may change the run state
     """
-    global __simulator  # pylint: disable=global-statement
+    global __simulator, __state_changed  # pylint: disable=global-statement
     __simulator = simulator
+    __state_changed = state_changed
@@ -124,9 +124,7 @@ class SPIFRegister(IntEnum):
             registers starting from a base
         :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
         """
-        return MultiCastCommand(
-            _RC_KEY + self.value + index, payload, time=None, repeat=_REPEATS,
-            delay_between_repeats=_DELAY_BETWEEN_REPEATS)
+        return _command(_RC_KEY + self.value + index, payload)
 
     def delayed_command(self, get_payload, index=0):
         """ Make a command to send to a SPIF device to set a register value,
@@ -144,6 +142,35 @@ class SPIFRegister(IntEnum):
             delay_between_repeats=_DELAY_BETWEEN_REPEATS, index=index)
 
 
+# The keys of the SPIF registers written by the functions below, worked out
+# once rather than on each call
+_RC_MP_KEY_BASE = _RC_KEY + SPIFRegister.MP_KEY_BASE.value
+_RC_MP_FLD_MASK_BASE = _RC_KEY + SPIFRegister.MP_FLD_MASK_BASE.value
+_RC_MP_FLD_SHIFT_BASE = _RC_KEY + SPIFRegister.MP_FLD_SHIFT_BASE.value
+_RC_MP_FLD_LIMIT_BASE = _RC_KEY + SPIFRegister.MP_FLD_LIMIT_BASE.value
+_RC_FL_VALUE_BASE = _RC_KEY + SPIFRegister.FL_VALUE_BASE.value
+_RC_FL_MASK_BASE = _RC_KEY + SPIFRegister.FL_MASK_BASE.value
+_RC_IR_KEY_BASE = _RC_KEY + SPIFRegister.IR_KEY_BASE.value
+_RC_IR_MASK_BASE = _RC_KEY + SPIFRegister.IR_MASK_BASE.value
+_RC_IR_ROUTE_BASE = _RC_KEY + SPIFRegister.IR_ROUTE_BASE.value
+_RC_DIST_KEY_BASE = _RC_KEY + SPIFRegister.DIST_KEY_BASE.value
+_RC_DIST_MASK_BASE = _RC_KEY + SPIFRegister.DIST_MASK_BASE.value
+_RC_DIST_SHIFT_BASE = _RC_KEY + SPIFRegister.DIST_SHIFT_BASE.value
+
+
+def _command(key, payload):
+    """
+    Make a command to send to a register, with the standard repeats.
+
+    :param int key: The key of the register to send to
+    :param int payload: The payload to use in the command
+    :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
+    """
+    return MultiCastCommand(
+        key, payload, time=None, repeat=_REPEATS,
+        delay_between_repeats=_DELAY_BETWEEN_REPEATS)
+
+
 def set_mapper_key(pipe, key):
     """
     Get a command to set the output base key for packets from SPIF.  This
@@ -153,7 +180,7 @@ def set_mapper_key(pipe, key):
     :param int key: The output key to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.MP_KEY_BASE.cmd(key, pipe)
+    return _command(_RC_MP_KEY_BASE + pipe, key)
 
 
 def set_field_mask(pipe, index, mask):
@@ -167,7 +194,7 @@ def set_field_mask(pipe, index, mask):
     :param int mask: The mask to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.MP_FLD_MASK_BASE.cmd(mask, (pipe * N_FIELDS) + index)
+    return _command(_RC_MP_FLD_MASK_BASE + (pipe * N_FIELDS) + index, mask)
 
 
 def set_field_shift(pipe, index, shift):
@@ -182,8 +209,7 @@ def set_field_shift(pipe, index, shift):
         The shift value to set (0-31); positive = right, negative = left
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.MP_FLD_SHIFT_BASE.cmd(
-        shift, (pipe * N_FIELDS) + index)
+    return _command(_RC_MP_FLD_SHIFT_BASE + (pipe * N_FIELDS) + index, shift)
 
 
 def set_field_limit(pipe, index, limit):
@@ -196,8 +222,7 @@ def set_field_limit(pipe, index, limit):
     :param int limit: The maximum value of the field
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.MP_FLD_LIMIT_BASE.cmd(
-        limit, (pipe * N_FIELDS) + index)
+    return _command(_RC_MP_FLD_LIMIT_BASE + (pipe * N_FIELDS) + index, limit)
 
 
 def set_filter_value(pipe, index, value):
@@ -211,8 +236,7 @@ def set_filter_value(pipe, index, value):
     :param int value: The filter value to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.FL_VALUE_BASE.cmd(
-        value, (pipe * N_FILTERS) + index)
+    return _command(_RC_FL_VALUE_BASE + (pipe * N_FILTERS) + index, value)
 
 
 def set_filter_mask(pipe, index, mask):
@@ -226,8 +250,7 @@ def set_filter_mask(pipe, index, mask):
     :param int mask: The filter mask to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.FL_MASK_BASE.cmd(
-        mask, (pipe * N_FILTERS) + index)
+    return _command(_RC_FL_MASK_BASE + (pipe * N_FILTERS) + index, mask)
 
 
 def set_input_key(pipe, index, key):
@@ -242,7 +265,7 @@ def set_input_key(pipe, index, key):
     :param int key: The key to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.IR_KEY_BASE.cmd(key, (pipe * N_INPUTS) + index)
+    return _command(_RC_IR_KEY_BASE + (pipe * N_INPUTS) + index, key)
 
 
 def set_input_mask(pipe, index, mask):
@@ -257,7 +280,7 @@ def set_input_mask(pipe, index, mask):
     :param int mask: The mask to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.IR_MASK_BASE.cmd(mask, (pipe * N_INPUTS) + index)
+    return _command(_RC_IR_MASK_BASE + (pipe * N_INPUTS) + index, mask)
 
 
 def set_input_route(pipe, index, route):
@@ -275,7 +298,7 @@ def set_input_route(pipe, index, route):
     :param int route: The route to set
     :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
     """
-    return SPIFRegister.IR_ROUTE_BASE.cmd(route, (pipe * N_INPUTS) + index)
+    return _command(_RC_IR_ROUTE_BASE + (pipe * N_INPUTS) + index, route)
 
 
 def set_distiller_key(index, key):
@@ -288,7 +311,7 @@ def set_distiller_key(index, key):
     :param int key: The key to set
     :rtype: MulticastCommand
     """
-    return SPIFRegister.DIST_KEY_BASE.cmd(key, index)
+    return _command(_RC_DIST_KEY_BASE + index, key)
 
 
 def set_distiller_mask(index, mask):
@@ -301,7 +324,7 @@ def set_distiller_mask(index, mask):
     :param int mask: The mask to set
     :rtype: MulticastCommand
     """
-    return SPIFRegister.DIST_MASK_BASE.cmd(mask, index)
+    return _command(_RC_DIST_MASK_BASE + index, mask)
 
 
 def set_distiller_mask_delayed(index, mask_func):
@@ -327,7 +350,7 @@ def set_distiller_shift(index, shift):
     :param int shift: The shift to set
     :rtype: MulticastCommand
     """
-    return SPIFRegister.DIST_SHIFT_BASE.cmd(shift, index)
+    return _command(_RC_DIST_SHIFT_BASE + index, shift)
 
 
 class _DelayedMultiCastCommand(MultiCastCommand):
@@ -415,9 +438,7 @@ class SpiNNFPGARegister(IntEnum):
             registers starting from a base
         :rtype: ~spinn_front_end_common.utility_models.MultiCastCommand
         """
-        return MultiCastCommand(
-            _LC_KEY + self.value + index, payload, time=None, repeat=_REPEATS,
-            delay_between_repeats=_DELAY_BETWEEN_REPEATS)
+        return _command(_LC_KEY + self.value + index, payload)
 
     def delayed_command(self, get_payload, index=0):
         """
@@ -436,6 +457,11 @@ class SpiNNFPGARegister(IntEnum):
             delay_between_repeats=_DELAY_BETWEEN_REPEATS, index=index)
 
 
+# The keys of the FPGA registers written by the functions below
+_LC_XP_KEY_BASE = _LC_KEY + SpiNNFPGARegister.XP_KEY_BASE.value
+_LC_XP_MASK_BASE = _LC_KEY + SpiNNFPGARegister.XP_MASK_BASE.value
+
+
 def set_xp_key(index, key):
     """ Get a command to set the key of the output via the FPGA.
         This tells the FPGA to route this key to the external device.
@@ -444,7 +470,7 @@ def set_xp_key(index, key):
     :param int key: The key to set
     :rtype: MulticastCommand
     """
-    return SpiNNFPGARegister.XP_KEY_BASE.cmd(key, index)
+    return _command(_LC_XP_KEY_BASE + index, key)
 
 
 def set_xp_key_delayed(index, key_func):
@@ -467,7 +493,7 @@ def set_xp_mask(index, mask):
     :param int mask: The mask to set
     :rtype: MulticastCommand
     """
-    return SpiNNFPGARegister.XP_MASK_BASE.cmd(mask, index)
+    return _command(_LC_XP_MASK_BASE + index, mask)
 
 
 def set_xp_mask_delayed(index, mask_func):
@@ -11,12 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from spinn_utilities.overrides import overrides
 from pacman.model.graphs.machine import MachineFPGAVertex
 from pacman.model.graphs.application import (
     Application2DFPGAVertex, FPGAConnection)
-from pacman.model.graphs.common import Slice
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.routing_info import BaseKeyAndMask, RoutingInfo
 from pacman.utilities.constants import BITS_IN_KEY
@@ -33,6 +32,14 @@ from .spif_devices import (
     set_filter_mask, set_filter_value, set_mapper_key,
     set_input_key, set_input_mask, set_input_route)
 
+# Module level copies of the class constants below, so that methods do not
+# have to look them up through the instance
+_Y_MASK = 1
+_X_MASK = 3
+_X_PER_ROW = 4
+#: The number of bits in _X_PER_ROW
+_X_PER_ROW_BITS = 2
+
 
 class SPIFRetinaDevice(
         Application2DFPGAVertex, PopulationApplicationVertex,
@@ -43,26 +50,36 @@ class SPIFRetinaDevice(
 
     #: SPIF outputs to 8 FPGA output links, so we split into (2 x 4), meaning
     #: a mask of (1 x 3)
-    Y_MASK = 1
+    Y_MASK = _Y_MASK
 
     #: See Y_MASK for description
-    X_MASK = 3
+    X_MASK = _X_MASK
 
     #: The number of X values per row
-    X_PER_ROW = 4
+    X_PER_ROW = _X_PER_ROW
 
     #: The number of devices in existence, to work out the key
     __n_devices = 0
 
     __slots__ = (
+        "__key_shift",
+        "__key_mask",
+        "__source_x_shift",
+        "__source_y_shift",
+        "__sub_square_x_mask",
+        "__sub_square_y_shift",
+        "__n_atoms_per_subsquare",
+        "__fpga_key_offsets",
         "__spif_mask",
-        "__index_by_slice",
         "__base_key",
         "__pipe",
         "__input_y_mask",
         "__input_y_shift",
         "__input_x_mask",
-        "__input_x_shift")
+        "__input_x_shift",
+        "__key_and_mask_cache",
+        "__start_resume_commands",
+        "__pause_stop_commands")
 
     @classmethod
     def __issue_device_id(cls, base_key):
@@ -112,7 +129,7 @@ class SPIFRetinaDevice(
         :type chip_coords: tuple(int, int) or None
         """
         # Do some checks
-        if sub_width < self.X_MASK + 1 or sub_height < self.Y_MASK + 1:
+        if sub_width < _X_MASK + 1 or sub_height < _Y_MASK + 1:
             raise ConfigurationException(
                 "The sub-squares must be >=4 x >= 2"
                 f" ({sub_width} x {sub_height} specified)")
@@ -153,16 +170,48 @@ class SPIFRetinaDevice(
         x_bits = self._x_bits
         y_bits = self._y_bits
 
-        # Mask to apply to route packets at input
-        n_key_bits = BITS_IN_KEY - self._key_shift
-        key_mask = (1 << n_key_bits) - 1
-        self.__spif_mask = (
-            (key_mask << self._key_shift) +
-            (self.Y_MASK << self._source_y_shift) +
-            (self.X_MASK << self._source_x_shift))
-
-        # A dictionary to get vertex index from FPGA and slice
-        self.__index_by_slice = dict()
+        # The shifts are worked out from the sizes each time they are read,
+        # but they can't change, so keep the values
+        self.__key_shift = self._key_shift
+        self.__source_x_shift = self._source_x_shift
+        self.__source_y_shift = self._source_y_shift
+        n_key_bits = BITS_IN_KEY - self.__key_shift
+        self.__key_mask = ((1 << n_key_bits) - 1) << self.__key_shift
+
+        # Integer ceiling division; no need to go through floats.  The width
+        # and sub-width are both powers of 2, so this is too, and sub-squares
+        # can be decoded with a mask and shift.
+        n_squares_per_row = -(-width // sub_width)
+        self.__sub_square_x_mask = n_squares_per_row - 1
+        self.__sub_square_y_shift = n_squares_per_row.bit_length() - 1
+
+        # The part of the key that identifies each of the FPGA input links;
+        # these are the same for all keys so are folded into constants here.
+        # The links used are all odd, so the link id shifted right by one is
+        # a dense index, and a tuple is smaller than a dict keyed on link id.
+        self.__fpga_key_offsets: Tuple[int, ...] = tuple(
+            (fpga_y << self.__source_y_shift) |
+            (fpga_x << self.__source_x_shift)
+            for fpga_x, fpga_y in map(
+                self.__fpga_indices, SPIF_INPUT_FPGA_LINKS))
+
+        # Mask to apply to route packets at input; the fields are disjoint,
+        # so they are combined with | and any overlap would show up as a
+        # wrong mask rather than being hidden by a carry
+        fpga_y_mask = _Y_MASK << self.__source_y_shift
+        fpga_x_mask = _X_MASK << self.__source_x_shift
+        assert not (self.__key_mask & fpga_y_mask)
+        assert not (self.__key_mask & fpga_x_mask)
+        assert not (fpga_y_mask & fpga_x_mask)
+        self.__spif_mask = self.__key_mask | fpga_y_mask | fpga_x_mask
+
+        # The vertex index can be recovered from the slice from this, as
+        # each sub-square has the same number of atoms
+        self.__n_atoms_per_subsquare = sub_width * sub_height
+
+        # The keys and masks of machine vertices by (FPGA link, index)
+        self.__key_and_mask_cache: Dict[Tuple[int, int], BaseKeyAndMask] = (
+            dict())
 
         self.__pipe = pipe
         self.__base_key = self.__issue_device_id(base_key)
@@ -174,6 +223,11 @@ class SPIFRetinaDevice(
         self.__input_y_mask = ((1 << y_bits) - 1) << input_y_shift
         self.__input_y_shift = self.__unsigned(input_y_shift - x_bits)
 
+        # Nothing the commands depend on changes after this point, so
+        # make them once now
+        self.__start_resume_commands = tuple(self.__build_start_resume())
+        self.__pause_stop_commands = (SpiNNFPGARegister.STOP.cmd(), )
+
     @staticmethod
     def __unsigned(n):
         return n & 0xFFFFFFFF
@@ -200,18 +254,17 @@ class SPIFRetinaDevice(
     def __fpga_indices(self, fpga_link_id):
         # We use every other odd link, so we can work out the "index" of the
         # link in the list as follows, and we can then split the index into
-        # x and y components
-        fpga_index = (fpga_link_id - 1) // 2
-        fpga_x_index = fpga_index % self.X_PER_ROW
-        fpga_y_index = fpga_index // self.X_PER_ROW
+        # x and y components; _X_PER_ROW is a power of 2 so this can be done
+        # with masks and shifts
+        fpga_index = (fpga_link_id - 1) >> 1
+        fpga_x_index = fpga_index & (_X_PER_ROW - 1)
+        fpga_y_index = fpga_index >> _X_PER_ROW_BITS
         return fpga_x_index, fpga_y_index
 
-    @overrides(Application2DFPGAVertex.get_incoming_slice_for_link)
-    def get_incoming_slice_for_link(
-            self, link: FPGAConnection, index: int) -> Slice:
-        vertex_slice = super().get_incoming_slice_for_link(link, index)
-        self.__index_by_slice[link.fpga_link_id, vertex_slice] = index
-        return vertex_slice
+    @overrides(Application2DFPGAVertex._sub_square_from_index)
+    def _sub_square_from_index(self, index: int) -> Tuple[int, int]:
+        return (index & self.__sub_square_x_mask,
+                index >> self.__sub_square_y_shift)
 
     @overrides(Application2DFPGAVertex.get_machine_fixed_key_and_mask)
     def get_machine_fixed_key_and_mask(
@@ -219,28 +272,37 @@ class SPIFRetinaDevice(
             partition_id: str) -> BaseKeyAndMask:
         assert isinstance(machine_vertex, MachineFPGAVertex)
         fpga_link_id = machine_vertex.fpga_link_id
-        vertex_slice = machine_vertex.vertex_slice
-        index = self.__index_by_slice[fpga_link_id, vertex_slice]
+        index = (machine_vertex.vertex_slice.lo_atom //
+                 self.__n_atoms_per_subsquare)
+        cached = self.__key_and_mask_cache.get((fpga_link_id, index))
+        if cached is not None:
+            return cached
         key_and_mask = self._get_key_and_mask(self.__base_key, index)
 
-        fpga_x, fpga_y = self.__fpga_indices(fpga_link_id)
-
         # Build the key from the components
-        fpga_key = key_and_mask.key + (
-            (fpga_y << self._source_y_shift) +
-            (fpga_x << self._source_x_shift))
+        fpga_key = (
+            key_and_mask.key | self.__fpga_key_offsets[fpga_link_id >> 1])
         fpga_mask = key_and_mask.mask | self.__spif_mask
-        return BaseKeyAndMask(fpga_key, fpga_mask)
+        cached = BaseKeyAndMask(fpga_key, fpga_mask)
+        self.__key_and_mask_cache[fpga_link_id, index] = cached
+        return cached
 
     @overrides(Application2DFPGAVertex.get_fixed_key_and_mask)
     def get_fixed_key_and_mask(self, partition_id: str) -> BaseKeyAndMask:
-        n_key_bits = BITS_IN_KEY - self._key_shift
-        key_mask = ((1 << n_key_bits) - 1) << self._key_shift
-        return BaseKeyAndMask(self.__base_key << self._key_shift, key_mask)
+        return BaseKeyAndMask(
+            self.__base_key << self.__key_shift, self.__key_mask)
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.start_resume_commands)
     def start_resume_commands(self) -> Iterable[MultiCastCommand]:
+        return self.__start_resume_commands
+
+    def __build_start_resume(self) -> List[MultiCastCommand]:
+        """
+        Make the commands to configure and start SPIF.
+
+        :rtype: list(MultiCastCommand)
+        """
         # Make sure everything has stopped
         commands = [SpiNNFPGARegister.STOP.cmd()]
 
@@ -256,11 +318,11 @@ class SPIFRetinaDevice(
             set_field_mask(self.__pipe, 0, self.__input_x_mask),
             set_field_shift(self.__pipe, 0, self.__input_x_shift),
             set_field_limit(self.__pipe, 0,
-                            (self.width - 1) << self._source_x_shift),
+                            (self.width - 1) << self.__source_x_shift),
             set_field_mask(self.__pipe, 1, self.__input_y_mask),
             set_field_shift(self.__pipe, 1, self.__input_y_shift),
             set_field_limit(self.__pipe, 1,
-                            (self.height - 1) << self._source_y_shift),
+                            (self.height - 1) << self.__source_y_shift),
             # These are unused but set them to be sure
             set_field_mask(self.__pipe, 2, 0),
             set_field_shift(self.__pipe, 2, 0),
@@ -280,19 +342,15 @@ class SPIFRetinaDevice(
 
         # Configure the output routing key
         commands.append(set_mapper_key(
-            self.__pipe, self.__base_key << self._key_shift))
+            self.__pipe, self.__base_key << self.__key_shift))
 
         # Configure the links to send packets to the 8 FPGAs using the
         # lower bits
-        commands.extend(
-            set_input_key(self.__pipe, i, self.__spif_key(15 - (i * 2)))
-            for i in range(8))
-        commands.extend(
-            set_input_mask(self.__pipe, i, self.__spif_mask)
-            for i in range(8))
-        commands.extend(
-            set_input_route(self.__pipe, i, i)
-            for i in range(8))
+        for i in range(8):
+            commands.append(
+                set_input_key(self.__pipe, i, self.__spif_key(15 - (i * 2))))
+            commands.append(set_input_mask(self.__pipe, i, self.__spif_mask))
+            commands.append(set_input_route(self.__pipe, i, i))
 
         # Send the start signal
         commands.append(SpiNNFPGARegister.START.cmd())
@@ -300,16 +358,14 @@ class SPIFRetinaDevice(
         return commands
 
     def __spif_key(self, fpga_link_id):
-        x, y = self.__fpga_indices(fpga_link_id)
-        return ((self.__base_key << self._key_shift) +
-                (x << self._source_x_shift) +
-                (y << self._source_y_shift))
+        return ((self.__base_key << self.__key_shift) |
+                self.__fpga_key_offsets[fpga_link_id >> 1])
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self) -> Iterable[MultiCastCommand]:
         # Send the stop signal
-        yield SpiNNFPGARegister.STOP.cmd()
+        return self.__pause_stop_commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
@@ -326,13 +382,13 @@ class SPIFRetinaDevice(
             pre_vertex, partition_id)
         x_end = x_start + self.sub_width
         y_end = y_start + self.sub_height
-        key_x = (key_and_mask.key >> self._source_x_shift) & self.X_MASK
-        key_y = (key_and_mask.key >> self._source_y_shift) & self.Y_MASK
+        key_x = (key_and_mask.key >> self.__source_x_shift) & _X_MASK
+        key_y = (key_and_mask.key >> self.__source_y_shift) & _Y_MASK
         neuron_id = (pre_vertex.vertex_slice.lo_atom +
-                     (key_y * self.X_PER_ROW) + key_x)
-        for x in range(x_start, x_end, self.X_MASK + 1):
-            for y in range(y_start, y_end, self.Y_MASK + 1):
-                key = (key_and_mask.key | (x << self._source_x_shift) |
-                       (y << self._source_y_shift))
+                     (key_y * _X_PER_ROW) + key_x)
+        for x in range(x_start, x_end, _X_MASK + 1):
+            for y in range(y_start, y_end, _Y_MASK + 1):
+                key = (key_and_mask.key | (x << self.__source_x_shift) |
+                       (y << self.__source_y_shift))
                 yield (neuron_id, key)
-                neuron_id += self.X_PER_ROW
+                neuron_id += _X_PER_ROW
@@ -15,7 +15,7 @@ from __future__ import annotations
 from collections import defaultdict
 import sys
 from typing import (
-    Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple, cast,
+    Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple,
     TYPE_CHECKING)
 import numpy
 from pyNN import descriptions
@@ -37,6 +37,9 @@ class AbstractPyNNModel(object, metaclass=AbstractBase):
     __slots__ = ()
     _max_atoms_per_core: Dict[type, Optional[Tuple[int, ...]]] = defaultdict(
         lambda: None)
+    # The default parameters and initial values of each model class, as
+    # working them out means inspecting the __init__ method
+    _defaults: Dict[type, Tuple[Dict[str, Any], Dict[str, Any]]] = dict()
 
     @classmethod
     def set_model_max_atoms_per_dimension_per_core(
@@ -103,6 +106,27 @@ class AbstractPyNNModel(object, metaclass=AbstractBase):
             svars = getattr(init, "_state_variables")
         return init, params, svars
 
+    @classmethod
+    def __get_defaults(cls) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get the default parameters and initial values of the model, working
+        them out only the first time they are asked for.
+
+        :rtype: tuple(dict(str, Any), dict(str, Any))
+        """
+        defaults = AbstractPyNNModel._defaults.get(cls)
+        if defaults is None:
+            init, params, svars = cls.__get_init_params_and_svars(cls)
+            parameters = get_dict_from_init(init, skip=svars, include=params)
+            if params is None and svars is None:
+                initial_values: Dict[str, Any] = {}
+            else:
+                initial_values = get_dict_from_init(
+                    init, skip=params, include=svars)
+            defaults = (parameters, initial_values)
+            AbstractPyNNModel._defaults[cls] = defaults
+        return defaults
+
     @classproperty
     def default_parameters(  # pylint: disable=no-self-argument
             cls) -> Dict[str, Any]:
@@ -111,8 +135,7 @@ class AbstractPyNNModel(object, metaclass=AbstractBase):
 
         :rtype: dict(str, Any)
         """
-        init, params, svars = cls.__get_init_params_and_svars(cast(type, cls))
-        return get_dict_from_init(init, skip=svars, include=params)
+        return dict(cls.__get_defaults()[0])
 
     @classproperty
     def default_initial_values(  # pylint: disable=no-self-argument
@@ -122,10 +145,7 @@ class AbstractPyNNModel(object, metaclass=AbstractBase):
 
         :rtype: dict(str, Any)
         """
-        init, params, svars = cls.__get_init_params_and_svars(cast(type, cls))
-        if params is None and svars is None:
-            return {}
-        return get_dict_from_init(init, skip=params, include=svars)
+        return dict(cls.__get_defaults()[1])
 
     @classmethod
     def get_parameter_names(cls) -> Sequence[str]:
@@ -13,6 +13,7 @@
 # limitations under the License.
 from math import ceil, log2, floor
 from collections import namedtuple, defaultdict
+from functools import lru_cache
 from pacman.model.graphs.application import ApplicationVirtualVertex
 from pacman.model.graphs.common.slice import Slice
 from pacman.model.graphs.common.mdslice import MDSlice
@@ -37,8 +38,11 @@ Source = namedtuple(
     "Source", ["projection", "local_delay", "delay_stage"])
 
 
+@lru_cache(maxsize=4096)
 def get_div_const(value):
-    """ Get the values used to perform fast division by an integer constant
+    """ Get the values used to perform fast division by an integer constant;
+        the same few divisors are asked for by every core, so the results
+        are remembered
 
     :param int value: The value to be divided by
     :return: The values required encoded as fields of a 32-bit integer
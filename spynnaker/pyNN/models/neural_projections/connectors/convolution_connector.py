@@ -15,13 +15,14 @@
 # limitations under the License.
 
 from __future__ import annotations
-from collections.abc import (Iterable, Sequence)
+from collections.abc import Sequence
 from typing import (
-    List, Optional, Sequence as TSequence, Tuple, Union,
+    Dict, List, Optional, Sequence as TSequence, Tuple, Union,
     cast, overload, TYPE_CHECKING)
 
 import numpy
-from numpy import floating, float64, integer, int16, uint16, uint32
+from numpy import (
+    floating, float32, float64, integer, int16, int64, uint16, uint32)
 from numpy.typing import NDArray
 
 from pyNN.random import RandomDistribution
@@ -30,8 +31,8 @@ from spinn_utilities.overrides import overrides
 
 from pacman.model.graphs.abstract_vertex import AbstractVertex
 from pacman.model.graphs.application import ApplicationVertex
-from pacman.model.graphs.common import Slice
 from pacman.model.graphs.machine import MachineVertex
+from pacman.utilities.utility_calls import is_power_of_2
 
 from spinn_front_end_common.utilities.constants import (
     BYTES_PER_SHORT, BYTES_PER_WORD)
@@ -49,6 +50,12 @@ if TYPE_CHECKING:
 #: The size of the connector struct in bytes
 CONNECTOR_CONFIG_SIZE = (10 * BYTES_PER_SHORT) + (4 * BYTES_PER_WORD)
 
+#: The number of words of the connector struct that hold uint16 values
+_N_SHORT_WORDS = (10 * BYTES_PER_SHORT) // BYTES_PER_WORD
+
+#: The most coordinate comparisons done at once when filtering edges
+_MAX_FILTER_COMPARISONS = 1 << 20
+
 
 _Weights = Union[
     int, float, List[Union[int, float]], Tuple[Union[int, float], ...],
@@ -71,10 +78,23 @@ class ConvolutionConnector(AbstractConnector):
 
     __slots__ = (
         "__kernel_weights",
+        "__kernel_shape",
+        "__half_kernel",
+        "__n_weights",
+        "__encoded_kernel_cache",
+        "__encode_buffer",
         "__strides",
         "__padding_shape",
         "__pool_shape",
         "__pool_stride",
+        "__strides_shift",
+        "__pool_stride_shift",
+        "__divide_by_strides",
+        "__divide_by_pool_stride",
+        "__post_offset",
+        "__shape_shorts",
+        "__div_consts",
+        "__post_shapes",
         "__positive_receptor_type",
         "__negative_receptor_type",
         "__filter_edges"
@@ -155,25 +175,71 @@ class ConvolutionConnector(AbstractConnector):
         """
         super().__init__(safe=safe, callback=callback, verbose=verbose)
 
-        self.__kernel_weights = self.__decode_kernel(
-            kernel_weights, kernel_shape)
+        # Average pooling divides the weights by the pooling area; this is
+        # done as the weights are decoded rather than as a separate pass
+        self.__pool_shape = self.__to_2d_shape(pool_shape, "pool_shape")
+        pool_area = 1
+        if self.__pool_shape is not None:
+            pool_area = int(numpy.prod(self.__pool_shape))
+        # Made C-contiguous (it might not be if given e.g. a Fortran-ordered
+        # array) so that it can be flattened without a copy
+        self.__kernel_weights = numpy.ascontiguousarray(self.__decode_kernel(
+            kernel_weights, kernel_shape, pool_area))
+        # The shape doesn't change after this, so keep the derived values
+        self.__kernel_shape: Tuple[int, int] = cast(
+            Tuple[int, int], self.__kernel_weights.shape)
+        self.__half_kernel: NDArray[integer] = (
+            numpy.array(self.__kernel_shape) // 2)
+        self.__n_weights: int = self.__kernel_weights.size
         self.__padding_shape = self.__decode_padding(padding)
         self.__filter_edges = filter_edges
+        # The post shapes already worked out, by pre shape
+        self.__post_shapes: Dict[Tuple[int, ...], Tuple[int, ...]] = dict()
 
         if strides is None:
             self.__strides = numpy.array((1, 1), dtype=integer)
         else:
             self.__strides = self.__to_2d_shape(strides, "strides")
-        self.__pool_shape = self.__to_2d_shape(pool_shape, "pool_shape")
         self.__pool_stride = self.__to_2d_shape(pool_stride, "pool_stride")
         if self.__pool_stride is None:
             self.__pool_stride = self.__pool_shape
-        if self.__pool_shape is not None:
-            self.__kernel_weights /= numpy.prod(self.__pool_shape)
+
+        # Division by powers of 2 can be done with a shift instead, which
+        # rounds negative values down just as floor division does
+        self.__strides_shift = self.__get_shift(self.__strides)
+        self.__pool_stride_shift = self.__get_shift(self.__pool_stride)
+        # ... and strides of 1 (the default) need no division at all
+        self.__divide_by_strides = bool(numpy.any(self.__strides != 1))
+        self.__divide_by_pool_stride = (
+            self.__pool_stride is not None and
+            bool(numpy.any(self.__pool_stride != 1)))
+
+        # The offset from pre- to post-coordinates, before striding
+        self.__post_offset = self.__padding_shape - self.__half_kernel
+
+        # The kernel shape and padding as written in the local-only data
+        self.__shape_shorts = numpy.array([
+            self.__kernel_shape[1], self.__kernel_shape[0],
+            self.__padding_shape[1], self.__padding_shape[0]], dtype=uint16)
+
+        # The constants for fast division by the strides in the local-only
+        # data, which again only depend on the parameters
+        ps_x, ps_y = 1, 1
+        if self.__pool_stride is not None:
+            ps_x, ps_y = self.__pool_stride
+        self.__div_consts = numpy.array([
+            get_div_const(self.__strides[1]), get_div_const(self.__strides[0]),
+            get_div_const(ps_y), get_div_const(ps_x)], dtype=uint32)
 
         self.__positive_receptor_type = positive_receptor_type
         self.__negative_receptor_type = negative_receptor_type
 
+        # The last encoded weights, with the synapse types and scales used
+        self.__encoded_kernel_cache: Optional[Tuple[
+            Tuple[int, int, float, float], NDArray[int16]]] = None
+        # Space to scale the weights in, made when first needed
+        self.__encode_buffer: Optional[NDArray[float64]] = None
+
     @property
     def positive_receptor_type(self) -> str:
         """
@@ -193,7 +259,7 @@ class ConvolutionConnector(AbstractConnector):
         return self.__negative_receptor_type
 
     @property
-    def kernel_weights(self) -> NDArray[float64]:
+    def kernel_weights(self) -> NDArray[float32]:
         """
         The weights for this connection.
 
@@ -205,35 +271,39 @@ class ConvolutionConnector(AbstractConnector):
         if shape is None:
             raise SynapticConfigurationException(
                 "kernel_shape must be provided")
-        if numpy.isscalar(shape):
-            assert isinstance(shape, int)
-            return (shape, shape)
+        if isinstance(shape, (int, numpy.integer)):
+            return (int(shape), int(shape))
         if isinstance(shape, tuple) and len(shape) == 2:
             return shape
         raise SynapticConfigurationException(f"Unknown kernel_shape: {shape}")
 
-    def __decode_kernel(self, w: _Weights, shape: _Shape) -> NDArray[float64]:
+    def __decode_kernel(self, w: _Weights, shape: _Shape,
+                        divisor: int) -> NDArray[float32]:
+        # Each of these makes a new float32 array of the weights / divisor
         if isinstance(w, (int, float)):
             _shape = self.__get_kernel_shape(shape)
-            return numpy.full(_shape, w, dtype=float64)
-        elif isinstance(w, (Sequence, numpy.ndarray)):
-            if all(isinstance(lst, (Sequence, numpy.ndarray)) for lst in w):
-                ws = cast(TSequence[TSequence[float]], w)
-                len0 = len(ws[0])
-                # 2D list
-                if not all(len(lst) == len0 for lst in ws):
-                    raise SynapticConfigurationException(
-                        "kernel_weights must be a 2D array with every row the"
-                        " same length")
-                return numpy.array(w, dtype=float64)
-            else:
-                # 1D list
-                _shape = self.__get_kernel_shape(shape)
-                return numpy.array(w, dtype=float64).reshape(_shape)
+            return numpy.full(
+                _shape, numpy.divide(w, divisor, dtype=float32),
+                dtype=float32)
+        elif isinstance(w, (list, tuple, numpy.ndarray)):
+            # numpy checks that any rows are all the same length
+            try:
+                weights = numpy.divide(w, divisor, dtype=float32)
+            except ValueError as e:
+                raise SynapticConfigurationException(
+                    "kernel_weights must be a 2D array with every row the"
+                    " same length") from e
+            if weights.ndim == 2:
+                return weights
+            if weights.ndim == 1:
+                return weights.reshape(self.__get_kernel_shape(shape))
+            raise SynapticConfigurationException(
+                "kernel_weights must be a 1D or 2D array")
         elif isinstance(w, RandomDistribution):
             _shape = self.__get_kernel_shape(shape)
-            return numpy.array(
-                w.next(numpy.prod(_shape)), dtype=float64).reshape(_shape)
+            return numpy.divide(
+                w.next(numpy.prod(_shape)), divisor,
+                dtype=float32).reshape(_shape)
         else:
             raise SynapticConfigurationException(
                 f"Unknown combination of kernel_weights ({w}) and"
@@ -255,41 +325,62 @@ class ConvolutionConnector(AbstractConnector):
             NDArray[integer]]:
         if shape is None:
             return None
-        if numpy.isscalar(shape):
+        if isinstance(shape, (int, float, numpy.integer, numpy.floating)):
             return numpy.array([shape, shape], dtype=integer)
-        assert isinstance(shape, tuple)
-        if len(shape) == 1:
-            return numpy.array([shape[0], 1], dtype=integer)
-        elif len(shape) == 2:
-            return numpy.array(shape, dtype=integer)
+        if isinstance(shape, (tuple, list)):
+            if len(shape) == 1:
+                return numpy.array([shape[0], 1], dtype=integer)
+            if len(shape) == 2:
+                return numpy.array(shape, dtype=integer)
         raise SynapticConfigurationException(
             f"{param_name} must be an int or a tuple(int, int)")
 
+    @staticmethod
+    def __get_shift(
+            divisors: Optional[NDArray[integer]]) -> Optional[NDArray[int64]]:
+        """
+        Get the shifts that divide by each of the divisors, or `None` if
+        they are not all powers of 2.
+        """
+        if divisors is None or not all(
+                is_power_of_2(int(divisor)) for divisor in divisors):
+            return None
+        return numpy.array(
+            [int(divisor).bit_length() - 1 for divisor in divisors],
+            dtype=int64)
+
     def __decode_padding(self, padding: _Padding) -> NDArray[integer]:
-        if isinstance(padding, (int, Iterable)):
+        # Note that this includes True and False, as bool is an int
+        if isinstance(padding, (int, numpy.integer, tuple, list)):
             return self.__to_2d_shape(padding, "padding")
-        elif padding is None or padding is False:
+        elif padding is None:
             return numpy.zeros(2, dtype=integer)
-        elif padding:
-            return self.__kernel_weights.shape // 2
         else:
             raise SynapticConfigurationException(
                 f"Unrecognized padding {padding}")
 
-    def get_post_shape(self, shape: Tuple[int, ...]):
+    def get_post_shape(self, shape: Tuple[int, ...]) -> Tuple[int, ...]:
         """
         Get the shape of the post image given the pre-image shape.
         """
-        _shape = numpy.array(shape)
-        if self.__pool_shape is not None:
-            _shape = _shape // self.__pool_stride
+        shape = tuple(shape)
+        post_shape = self.__post_shapes.get(shape)
+        if post_shape is not None:
+            return post_shape
 
-        kernel_shape = numpy.array(self.__kernel_weights.shape)
-        post_shape = (_shape - (kernel_shape - 1) +
-                      (2 * self.__padding_shape))
-
-        return tuple(int(i) for i in numpy.clip(
-            post_shape // self.__strides, 1, numpy.inf).astype(integer))
+        # Only two values, so this is done with plain ints
+        pool_stride = (1, 1)
+        if self.__pool_shape is not None:
+            assert self.__pool_stride is not None
+            pool_stride = self.__pool_stride
+        post_shape = tuple(
+            max(1, ((size // int(p_stride)) - k_size + 1 + 2 * int(pad)) //
+                int(stride))
+            for size, p_stride, k_size, pad, stride in zip(
+                shape, pool_stride, self.__kernel_shape,
+                self.__padding_shape, self.__strides))
+        self.__post_shapes[shape] = post_shape
+        return post_shape
 
     @overrides(AbstractConnector.validate_connection)
     def validate_connection(
@@ -302,7 +393,7 @@ class ConvolutionConnector(AbstractConnector):
                 "The ConvolutionConnector only works where the Populations"
                 " of a Projection are both 2D.  Please ensure that both the"
                 " Populations use a Grid2D structure.")
-        expected_post_shape = tuple(self.get_post_shape(pre.atoms_shape))
+        expected_post_shape = self.get_post_shape(pre.atoms_shape)
         if expected_post_shape != post.atoms_shape:
             raise ConfigurationException(
                 f"With a source population with shape {pre.atoms_shape}, "
@@ -344,14 +435,12 @@ class ConvolutionConnector(AbstractConnector):
         if min_delay is not None and max_delay is not None:
             if not (min_delay <= self.__delay(synapse_info) <= max_delay):
                 return 0
-        w, h = self.__kernel_weights.shape
-        return numpy.clip(w * h, 0, n_post_atoms)
+        return min(self.__n_weights, n_post_atoms)
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(
             self, synapse_info: SynapseInformation) -> int:
-        w, h = self.__kernel_weights.shape
-        return numpy.clip(w * h, 0, synapse_info.n_pre_neurons)
+        return min(self.__n_weights, synapse_info.n_pre_neurons)
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info: SynapseInformation) -> float:
@@ -368,51 +457,76 @@ class ConvolutionConnector(AbstractConnector):
                 s_info, source_vertex, target_vertex)
         pre_vertices = numpy.array(
             source_vertex.splitter.get_out_going_vertices(s_info.partition_id))
-        post_slice_ranges = self.__pre_as_post_slice_ranges(
-            m_vertex.vertex_slice for m_vertex in pre_vertices)
-        hlf_k_w, hlf_k_h = numpy.array(self.__kernel_weights.shape) // 2
-
+        post_slice_ranges = self.__pre_as_post(
+            self.__vertex_ranges(pre_vertices))
+        post_vertices = target_vertex.splitter.get_in_coming_vertices(
+            s_info.partition_id)
+
+        # Get ranges allowed in post for all the post vertices at once, as
+        # (max_x, max_y, -min_x, -min_y) so that all tests are the same way
+        post_ranges = self.__vertex_ranges(post_vertices)
+        numpy.subtract(
+            self.__half_kernel, post_ranges[:, 0], out=post_ranges[:, 0])
+        post_ranges[:, 1] += self.__half_kernel
+        post_bounds = post_ranges[:, ::-1].reshape(-1, 4)
+
+        # Test that the start coordinates are in range i.e. less than max,
+        # and that the end coordinates are in range i.e. more than min (so
+        # negated, less than -min) in one comparison of every (post, pre) pair
+        post_slice_ranges[:, 1] *= -1
+        pre_bounds = post_slice_ranges.reshape(-1, 4)
+
+        # The (post, pre) comparisons are done for blocks of post vertices
+        # so that the size of the temporary arrays stays bounded however
+        # many vertices there are
+        n_post_per_block = max(
+            1, _MAX_FILTER_COMPARISONS // max(1, pre_bounds.size))
         connected: List[Tuple[MachineVertex, List[MachineVertex]]] = []
-        for post in target_vertex.splitter.get_in_coming_vertices(
-                s_info.partition_id):
-            post_slice = post.vertex_slice
-            post_slice_x = post_slice.get_slice(0)
-            post_slice_y = post_slice.get_slice(1)
-
-            # Get ranges allowed in post
-            min_x = post_slice_x.start - hlf_k_w
-            max_x = (post_slice_x.stop + hlf_k_w) - 1
-            min_y = post_slice_y.start - hlf_k_h
-            max_y = (post_slice_y.stop + hlf_k_h) - 1
-
-            # Test that the start coordinates are in range i.e. less than max
-            start_in_range = numpy.logical_not(
-                numpy.any(post_slice_ranges[:, 0] > [max_x, max_y], axis=1))
-            # Test that the end coordinates are in range i.e. more than min
-            end_in_range = numpy.logical_not(
-                numpy.any(post_slice_ranges[:, 1] < [min_x, min_y], axis=1))
-            # When both things are true, we have a vertex in range
-            pre_in_range = pre_vertices[
-                numpy.logical_and(start_in_range, end_in_range)]
-            connected.append((post, list(pre_in_range)))
+        for start in range(0, len(post_vertices), n_post_per_block):
+            end = start + n_post_per_block
+            pre_in_range = numpy.all(
+                pre_bounds[None, :] <= post_bounds[start:end, None], axis=2)
+            connected.extend(
+                (post, list(pre_vertices[in_range]))
+                for post, in_range in zip(
+                    post_vertices[start:end], pre_in_range))
         return connected
 
-    def __pre_as_post_slice_ranges(
-            self, slices: Iterable[Slice]) -> NDArray[integer]:
+    @staticmethod
+    def __vertex_ranges(
+            vertices: TSequence[MachineVertex]) -> NDArray[int64]:
         """
-        Convert a generator of (multi-dimensional) pre-slices into an array of
-        post-slices.
+        Get the (x, y) coordinates of the first atom (in row 0) and the last
+        atom (in row 1) of the 2D slice of each of the vertices.
         """
-        pre_slices = ((s.get_slice(0), s.get_slice(1)) for s in slices)
-        coords = numpy.array([
-            ((px.start, py.start), (px.stop - 1, py.stop - 1))
-            for px, py in pre_slices])
-        if self.__pool_stride is not None:
-            coords //= self.__pool_stride
+        ranges = numpy.empty((len(vertices), 2, 2), dtype=int64)
+        for i, vertex in enumerate(vertices):
+            slice_x = vertex.vertex_slice.get_slice(0)
+            slice_y = vertex.vertex_slice.get_slice(1)
+            ranges[i, 0, 0] = slice_x.start
+            ranges[i, 0, 1] = slice_y.start
+            ranges[i, 1, 0] = slice_x.stop - 1
+            ranges[i, 1, 1] = slice_y.stop - 1
+        return ranges
+
+    def __pre_as_post(self, coords: NDArray[int64]) -> NDArray[int64]:
+        """
+        Convert an array of pre-vertex ranges, as produced by
+        :py:meth:`__vertex_ranges`, into an array of post-vertex ranges.
+        This is done in place in the given array.
+        """
+        if self.__divide_by_pool_stride:
+            if self.__pool_stride_shift is not None:
+                coords >>= self.__pool_stride_shift
+            else:
+                coords //= self.__pool_stride
 
-        kernel_shape = numpy.array(self.__kernel_weights.shape)
-        coords = coords - kernel_shape // 2 + self.__padding_shape
-        coords //= self.__strides
+        coords += self.__post_offset
+        if self.__divide_by_strides:
+            if self.__strides_shift is not None:
+                coords >>= self.__strides_shift
+            else:
+                coords //= self.__strides
         return coords
 
     @property
@@ -422,8 +536,7 @@ class ConvolutionConnector(AbstractConnector):
 
         :rtype: int
         """
-        n_weights = self.__kernel_weights.size
-        return n_weights * BYTES_PER_SHORT
+        return self.__n_weights * BYTES_PER_SHORT
 
     @property
     def kernel_n_weights(self) -> int:
@@ -432,7 +545,7 @@ class ConvolutionConnector(AbstractConnector):
 
         :rtype: int
         """
-        return self.__kernel_weights.size
+        return self.__n_weights
 
     @property
     def parameters_n_bytes(self) -> int:
@@ -453,28 +566,23 @@ class ConvolutionConnector(AbstractConnector):
         :param int weight_index:
         :rtype: ndarray
         """
-        # Get info about things
-        kernel_shape = self.__kernel_weights.shape
-        ps_x, ps_y = 1, 1
-        if self.__pool_stride is not None:
-            ps_x, ps_y = self.__pool_stride
-
         # Do a new list for remaining connector details as uint16s
         pos_synapse_type = app_edge.post_vertex.get_synapse_id_by_target(
             self.__positive_receptor_type)
         neg_synapse_type = app_edge.post_vertex.get_synapse_id_by_target(
             self.__negative_receptor_type)
 
-        # Produce the values needed
-        short_values = numpy.array([
-            kernel_shape[1], kernel_shape[0],
-            self.__padding_shape[1], self.__padding_shape[0],
+        # Produce the values needed, writing the uint16s and uint32s straight
+        # into the one array
+        values = numpy.empty(
+            CONNECTOR_CONFIG_SIZE // BYTES_PER_WORD, dtype=uint32)
+        short_values = values[:_N_SHORT_WORDS].view(uint16)
+        short_values[:len(self.__shape_shorts)] = self.__shape_shorts
+        short_values[len(self.__shape_shorts):] = (
             pos_synapse_type, neg_synapse_type, delay_stage, local_delay,
-            weight_index, 0], dtype=uint16)
-        long_values = numpy.array([
-            get_div_const(self.__strides[1]), get_div_const(self.__strides[0]),
-            get_div_const(ps_y), get_div_const(ps_x)], dtype=uint32)
-        return numpy.concatenate((short_values.view(uint32), long_values))
+            weight_index, 0)
+        values[_N_SHORT_WORDS:] = self.__div_consts
+        return values
 
     def get_encoded_kernel_weights(
             self, app_edge: ProjectionApplicationEdge,
@@ -486,13 +594,34 @@ class ConvolutionConnector(AbstractConnector):
         :param ndarray weight_scales:
         :rtype: ndarray
         """
-        encoded_kernel_weights = self.__kernel_weights.flatten()
-        neg_weights = encoded_kernel_weights < 0
-        pos_weights = encoded_kernel_weights > 0
         pos_synapse_type = app_edge.post_vertex.get_synapse_id_by_target(
             self.__positive_receptor_type)
         neg_synapse_type = app_edge.post_vertex.get_synapse_id_by_target(
             self.__negative_receptor_type)
-        encoded_kernel_weights[neg_weights] *= weight_scales[neg_synapse_type]
-        encoded_kernel_weights[pos_weights] *= weight_scales[pos_synapse_type]
-        return numpy.round(encoded_kernel_weights).astype(int16)
+        assert pos_synapse_type is not None
+        assert neg_synapse_type is not None
+        pos_scale = float(weight_scales[pos_synapse_type])
+        neg_scale = float(weight_scales[neg_synapse_type])
+
+        # The same weights are usually encoded for every core of the target,
+        # so reuse the last result if nothing it depends on has changed
+        key = (pos_synapse_type, neg_synapse_type, pos_scale, neg_scale)
+        if (self.__encoded_kernel_cache is not None and
+                self.__encoded_kernel_cache[0] == key):
+            return self.__encoded_kernel_cache[1]
+
+        kernel_weights = self.__kernel_weights.ravel()
+        if self.__encode_buffer is None:
+            self.__encode_buffer = numpy.empty(self.__n_weights, dtype=float64)
+        # Zero weights stay zero whichever scale is picked
+        numpy.multiply(
+            kernel_weights,
+            numpy.where(kernel_weights < 0, neg_scale, pos_scale),
+            out=self.__encode_buffer)
+        numpy.rint(self.__encode_buffer, out=self.__encode_buffer)
+        # This copy is kept, as it is handed out to callers
+        encoded_kernel_weights = self.__encode_buffer.astype(int16)
+        # Shared between callers, so must not be changed
+        encoded_kernel_weights.setflags(write=False)
+        self.__encoded_kernel_cache = (key, encoded_kernel_weights)
+        return encoded_kernel_weights
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 import math
-from typing import List, Optional, Sequence, TYPE_CHECKING
+import os
+from typing import Dict, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 import numpy
-from numpy import integer, uint32
-from numpy.typing import NDArray
+from numpy import int32, integer, uint32
+from numpy.random import Generator
+from numpy.typing import DTypeLike, NDArray
 
 from pyNN.random import NumpyRNG
 
@@ -27,6 +30,7 @@ from pacman.model.graphs.common import Slice
 
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
+from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.exceptions import SpynnakerException
 from spynnaker.pyNN.utilities import utility_calls
 
@@ -42,6 +46,40 @@ if TYPE_CHECKING:
 
 N_GEN_PARAMS = 8
 
+#: When choosing without replacement, the number of post neurons must be
+#: at least this many times the number chosen before repeated choices are
+#: redrawn rather than the whole population being shuffled
+_SPARSE_CHOICE_RATIO = 4
+
+#: The most random keys to hold at once when shuffling the post neurons
+_MAX_KEYS = 1 << 22
+
+#: The most threads to shuffle the post neurons in.  Each thread holds a
+#: block of keys (32 MiB at most) so this bounds the memory used, and the
+#: shuffle is limited by memory bandwidth rather than cores, so more threads
+#: than this gain little while taking cores from anything else running
+_MAX_THREADS = 4
+
+#: The kinds of random number generator the post neurons can be drawn with
+_RNG = Union[NumpyRNG, Generator]
+
+
+def _randint(rng: _RNG, high: int, size: Union[int, Tuple[int, ...], None],
+             dtype: DTypeLike) -> NDArray:
+    """
+    Draw integers in [0, high) from either kind of random number generator.
+
+    :param rng: The user's NumpyRNG or the shared numpy Generator
+    :type rng: ~pyNN.random.NumpyRNG or ~numpy.random.Generator
+    :param int high: One more than the largest integer to draw
+    :param size: The shape of the integers to draw
+    :param dtype: The type of the integers to draw
+    :rtype: ~numpy.ndarray
+    """
+    if isinstance(rng, Generator):
+        return rng.integers(0, high, size=size, dtype=dtype)
+    return rng.randint(0, high, size=size, dtype=dtype)
+
 
 class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
                                AbstractGenerateConnectorOnHost):
@@ -52,9 +90,9 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
 
     __slots__ = (
         "__allow_self_connections",
+        "__gen_params",
         "__n_post",
         "__post_neurons",
-        "__post_neurons_set",
         "__with_replacement",
         "__rng")
 
@@ -83,8 +121,9 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
             post-synaptic neuron has been connected to a pre-neuron, it can't
             be connected again.
         :param rng:
-            Seeded random number generator, or ``None`` to make one when
-            needed.
+            Seeded random number generator, or ``None`` to use the
+            generator shared through
+            :py:meth:`~spynnaker.pyNN.data.SpynnakerDataView.get_rng`.
         :type rng: ~pyNN.random.NumpyRNG or None
         :param callable callback:
             if given, a callable that display a progress bar on the terminal.
@@ -96,8 +135,8 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         self.__n_post = self._roundsize(n, "FixedNumberPostConnector")
         self.__allow_self_connections = allow_self_connections
         self.__with_replacement = with_replacement
-        self.__post_neurons: List[NDArray[integer]] = []
-        self.__post_neurons_set = False
+        self.__post_neurons: Optional[NDArray[int32]] = None
+        self.__gen_params: Dict[bool, NDArray[uint32]] = dict()
         self.__rng = rng
 
     def set_projection_information(self, synapse_info: SynapseInformation):
@@ -115,6 +154,13 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
                 "FixedNumberPostConnector will not work when "
                 "with_replacement=False, allow_self_connections=False "
                 "and n = n_post_neurons")
+        if (self.__n_post > 0 and
+                not self.__allow_self_connections and
+                synapse_info.n_post_neurons == 1 and
+                synapse_info.pre_population is synapse_info.post_population):
+            raise SpynnakerException(
+                "FixedNumberPostConnector will not work when "
+                "allow_self_connections=False and there is only one neuron")
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info: SynapseInformation) -> float:
@@ -129,43 +175,185 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
             synapse_info.delays, n_connections, synapse_info)
 
     def __build_post_neurons(
-            self, synapse_info: SynapseInformation) -> List[NDArray[integer]]:
-        rng = self.__rng or NumpyRNG()
-        post_neurons: List[NDArray[integer]] = \
-            [numpy.empty([0], dtype=integer)] * synapse_info.n_pre_neurons
-        # Loop over all the pre neurons
-        for m in range(synapse_info.n_pre_neurons):
-            if post_neurons[m] is None:
-                # If the pre and post populations are the same
-                # then deal with allow_self_connections=False
-                if (synapse_info.pre_population is
-                        synapse_info.post_population and
-                        not self.__allow_self_connections):
-                    # Create a list without the pre_neuron in it
-                    no_self_post_neurons = numpy.concatenate(
-                        [numpy.arange(0, m),
-                         numpy.arange(m + 1,
-                                      synapse_info.n_post_neurons)])
-
-                    # Now use this list in the random choice
-                    post_neurons[m] = rng.choice(
-                        no_self_post_neurons, self.__n_post,
-                        self.__with_replacement)
-                else:
-                    post_neurons[m] = rng.choice(
-                        synapse_info.n_post_neurons, self.__n_post,
-                        self.__with_replacement)
+            self, synapse_info: SynapseInformation) -> NDArray[int32]:
+        rng: _RNG = self.__rng or SpynnakerDataView.get_rng()
+        n_pre_neurons = synapse_info.n_pre_neurons
+        n_post_neurons = synapse_info.n_post_neurons
+
+        # If the pre and post populations are the same
+        # then deal with allow_self_connections=False
+        no_self = (
+            synapse_info.pre_population is synapse_info.post_population and
+            not self.__allow_self_connections)
+
+        sparse = (
+            not self.__with_replacement and
+            self.__n_post * _SPARSE_CHOICE_RATIO <= n_post_neurons)
+
+        # All the pre neurons are sampled at once, one row each; neuron ids
+        # always fit in 32 bits so the rows are kept as int32
+        pre_neurons = numpy.arange(n_pre_neurons, dtype=int32)[:, None]
+        if self.__with_replacement:
+            post_neurons = self.__draw(
+                rng, (n_pre_neurons, self.__n_post), pre_neurons,
+                n_post_neurons, no_self)
+        elif sparse:
+            post_neurons = self.__choose_sparse(
+                rng, pre_neurons, n_post_neurons, no_self)
+        else:
+            post_neurons = self.__choose_dense(
+                rng, n_pre_neurons, n_post_neurons, no_self)
+
+        # Sorted rows let the post neurons in a slice be found by bisection
+        # (the sparse choice is sorted already)
+        if not sparse:
+            post_neurons.sort(axis=1)
+        return post_neurons
+
+    @staticmethod
+    def __draw(
+            rng: _RNG, shape: Tuple[int, ...],
+            pre_neurons: NDArray[int32], n_post_neurons: int,
+            no_self: bool) -> NDArray[int32]:
+        """
+        Draw post neurons with replacement.  If self-connections are not
+        allowed, each is drawn from one fewer post neuron and those at or
+        above the pre neuron are moved up one, which skips the pre neuron
+        without having to draw again.
+
+        :param rng:
+        :type rng: ~pyNN.random.NumpyRNG or ~numpy.random.Generator
+        :param tuple(int) shape: The shape of the post neurons to draw
+        :param ~numpy.ndarray pre_neurons:
+            The pre neuron of each post neuron to draw, broadcast to shape
+        :param int n_post_neurons:
+        :param bool no_self:
+        :rtype: ~numpy.ndarray
+        """
+        if not no_self:
+            return _randint(rng, n_post_neurons, shape, int32)
+        post_neurons = _randint(rng, n_post_neurons - 1, shape, int32)
+        post_neurons += post_neurons >= pre_neurons
         return post_neurons
 
-    def _get_post_neurons(self, synapse_info: SynapseInformation):
+    def __choose_sparse(
+            self, rng: _RNG, pre_neurons: NDArray[int32],
+            n_post_neurons: int, no_self: bool) -> NDArray[int32]:
+        """
+        Choose without replacement when only a few of the post neurons are
+        needed, so that the work done is in proportion to the number chosen
+        rather than the number of post neurons.
+
+        Each row is drawn with replacement, and then any repeated choices
+        are drawn again until there are none left.  Nothing in this
+        favours any post neuron over another, so the result is a uniform
+        choice.
+
+        :param rng:
+        :type rng: ~pyNN.random.NumpyRNG or ~numpy.random.Generator
+        :param ~numpy.ndarray pre_neurons: The pre neurons, as a column
+        :param int n_post_neurons:
+        :param bool no_self:
+        :rtype: ~numpy.ndarray
+        """
+        post_neurons = self.__draw(
+            rng, (len(pre_neurons), self.__n_post), pre_neurons,
+            n_post_neurons, no_self)
+        while True:
+            # Sorting puts any repeats next to each other
+            post_neurons.sort(axis=1)
+            redraw = numpy.zeros(post_neurons.shape, dtype=bool)
+            numpy.equal(
+                post_neurons[:, 1:], post_neurons[:, :-1], out=redraw[:, 1:])
+            n_redraw = numpy.count_nonzero(redraw)
+            if not n_redraw:
+                return post_neurons
+            post_neurons[redraw] = self.__draw(
+                rng, (n_redraw, ),
+                numpy.broadcast_to(pre_neurons, post_neurons.shape)[redraw],
+                n_post_neurons, no_self)
+
+    def __choose_dense(
+            self, rng: _RNG, n_pre_neurons: int, n_post_neurons: int,
+            no_self: bool) -> NDArray[int32]:
+        """
+        Choose without replacement by shuffling all the post neurons; the
+        post neurons with the n smallest of a set of random keys are a
+        uniform random choice.  The keys are made a block of rows at a time
+        so that their memory use is bounded.
+
+        Each block has its own generator, spawned from a single draw of the
+        given random number generator, so the blocks are independent of
+        each other and of the order they are made in, while the result as a
+        whole is still reproducible from the seed.  This lets the blocks be
+        made in parallel threads when there is more than one, as NumPy
+        releases the GIL while it makes and partitions the keys; there is
+        then one block of keys per thread in memory at a time.
+
+        :param rng:
+        :type rng: ~pyNN.random.NumpyRNG or ~numpy.random.Generator
+        :param int n_pre_neurons:
+        :param int n_post_neurons:
+        :param bool no_self:
+        :rtype: ~numpy.ndarray
+        """
+        post_neurons = numpy.empty(
+            (n_pre_neurons, self.__n_post), dtype=int32)
+        block_rows = max(1, _MAX_KEYS // n_post_neurons)
+        starts = range(0, n_pre_neurons, block_rows)
+        seeds = numpy.random.SeedSequence(
+            int(_randint(rng, 0xFFFFFFFF, None, uint32))).spawn(len(starts))
+
+        def shuffle_block(start: int, seed: numpy.random.SeedSequence):
+            self.__shuffle_block(
+                numpy.random.default_rng(seed), post_neurons, start,
+                min(start + block_rows, n_pre_neurons), n_post_neurons,
+                no_self)
+
+        n_threads = min(len(starts), os.cpu_count() or 1, _MAX_THREADS)
+        if n_threads <= 1:
+            for start, seed in zip(starts, seeds):
+                shuffle_block(start, seed)
+        else:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                # Go through the results so that any error is raised here
+                for _ in executor.map(shuffle_block, starts, seeds):
+                    pass
+        return post_neurons
+
+    def __shuffle_block(
+            self, generator: numpy.random.Generator,
+            post_neurons: NDArray[int32], start: int, end: int,
+            n_post_neurons: int, no_self: bool):
+        """
+        Choose the post neurons of a block of pre neurons by shuffling.
+
+        :param ~numpy.random.Generator generator:
+        :param ~numpy.ndarray post_neurons: Where to put the choices
+        :param int start: The first pre neuron of the block
+        :param int end: The pre neuron after the last of the block
+        :param int n_post_neurons:
+        :param bool no_self:
+        """
+        keys = generator.random((end - start, n_post_neurons))
+        if no_self:
+            # Make sure the pre neuron is never one of the smallest
+            rows = numpy.arange(end - start, dtype=int32)
+            keys[rows, rows + start] = numpy.inf
+        post_neurons[start:end] = numpy.argpartition(
+            keys, self.__n_post - 1, axis=1)[:, :self.__n_post]
+
+    def _get_post_neurons(
+            self, synapse_info: SynapseInformation) -> NDArray[int32]:
         """
         :param SynapseInformation synapse_info:
-        :rtype: list(~numpy.ndarray)
+        :return: The post neurons of each pre neuron, one row each
+        :rtype: ~numpy.ndarray
         """
-        # If we haven't set the array up yet, do it now
-        if not self.__post_neurons_set:
+        # If we haven't set the array up yet, do it now; this is only ever
+        # asked for when the connections are made on the host
+        if self.__post_neurons is None:
             self.__post_neurons = self.__build_post_neurons(synapse_info)
-            self.__post_neurons_set = True
 
             # if verbose open a file to output the connectivity
             if self.verbose:
@@ -179,16 +367,14 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
                                     synapse_info.n_post_neurons,
                                     self.__n_post)],
                                   fmt="%u,%u,%u")
-                    for post_neuron in self.__post_neurons:
-                        numpy.savetxt(
-                            file_handle, post_neuron,
-                            fmt=("%u," * (self.__n_post - 1) + "%u"))
+                    numpy.savetxt(file_handle, self.__post_neurons,
+                                  fmt="%u", delimiter=",")
 
         return self.__post_neurons
 
     def _post_neurons_in_slice(
             self, post_vertex_slice: Slice, n: int,
-            synapse_info: SynapseInformation) -> NDArray[integer]:
+            synapse_info: SynapseInformation) -> NDArray[int32]:
         """
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n:
@@ -197,13 +383,12 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         """
         post_neurons = self._get_post_neurons(synapse_info)
 
-        # Get the nth array and get the bits we need for
+        # Get a view of the nth row and get the bits we need for
         # this post-vertex slice
         this_post_neuron_array = post_neurons[n]
-
-        return this_post_neuron_array[numpy.logical_and(
-            post_vertex_slice.lo_atom <= this_post_neuron_array,
-            this_post_neuron_array <= post_vertex_slice.hi_atom)]
+        start, end = self.__row_bounds(
+            this_post_neuron_array, post_vertex_slice)
+        return this_post_neuron_array[start:end]
 
     def _n_post_neurons_in_slice(
             self, post_vertex_slice: Slice, n: int,
@@ -218,34 +403,61 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         :rtype: int
         """
         post_neurons = self._get_post_neurons(synapse_info)
+        start, end = self.__row_bounds(post_neurons[n], post_vertex_slice)
+        return int(end - start)
 
-        # Get the nth array and get the bits we need for
-        # this post-vertex slice
-        this_post_neuron_array = post_neurons[n]
+    @staticmethod
+    def __row_bounds(
+            row: NDArray[int32], post_vertex_slice: Slice) -> Tuple[int, int]:
+        """
+        Find where the post neurons in a slice are in a sorted row.
 
-        return numpy.count_nonzero(numpy.logical_and(
-            post_vertex_slice.lo_atom <= this_post_neuron_array,
-            this_post_neuron_array <= post_vertex_slice.hi_atom))
+        :param ~numpy.ndarray row:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The start and end of the post neurons in the slice
+        :rtype: tuple(int, int)
+        """
+        start, end = numpy.searchsorted(
+            row, (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1))
+        return start, end
+
+    @staticmethod
+    def __slice_mask(
+            post_neurons: NDArray[int32], post_vertex_slice: Slice) -> Tuple[
+                NDArray[numpy.bool_], NDArray[integer], int]:
+        """
+        Find the post neurons of every pre neuron that are in a slice.
+
+        :param ~numpy.ndarray post_neurons:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The mask of post neurons in the slice, the number in the
+            slice for each pre neuron, and the total number in the slice
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, int)
+        """
+        in_slice = numpy.logical_and(
+            post_vertex_slice.lo_atom <= post_neurons,
+            post_neurons <= post_vertex_slice.hi_atom)
+        n_in_slice = numpy.count_nonzero(in_slice, axis=1)
+        return in_slice, n_in_slice, int(n_in_slice.sum())
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, n_post_atoms: int, synapse_info: SynapseInformation,
             min_delay: Optional[float] = None,
             max_delay: Optional[float] = None) -> int:
+        n_total = synapse_info.n_pre_neurons * synapse_info.n_post_neurons
         prob_in_slice = min(
             n_post_atoms / float(
                 synapse_info.n_post_neurons), 1.0)
         n_connections = utility_calls.get_probable_maximum_selected(
-            synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            self.__n_post, prob_in_slice, chance=1.0/100000.0)
+            n_total, self.__n_post, prob_in_slice, chance=1.0/100000.0)
 
         if min_delay is None or max_delay is None:
             return int(math.ceil(n_connections))
 
         return self._get_n_connections_from_pre_vertex_with_delay_maximum(
-            synapse_info.delays,
-            synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            n_connections, min_delay, max_delay, synapse_info)
+            synapse_info.delays, n_total, n_connections, min_delay,
+            max_delay, synapse_info)
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(
@@ -267,37 +479,28 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
     def create_synaptic_block(
             self, post_slices: Sequence[Slice], post_vertex_slice: Slice,
             synapse_type: int, synapse_info: SynapseInformation) -> NDArray:
-        # Get lo and hi for the pre vertex
-        lo = 0
-        hi = synapse_info.n_pre_neurons - 1
-
-        # Get number of connections
-        n_connections = sum(
-            self._n_post_neurons_in_slice(post_vertex_slice, n, synapse_info)
-            for n in range(lo, hi + 1))
-
-        # Set up the block
-        block = numpy.zeros(
+        post_neurons = self._get_post_neurons(synapse_info)
+        in_slice, n_in_slice, n_connections = self.__slice_mask(
+            post_neurons, post_vertex_slice)
+
+        # Set up source and target; the mask is read row by row so each
+        # pre neuron is repeated once for each of its targets.  These are
+        # kept as contiguous arrays to make the weights and delays from,
+        # rather than reading them back out of the interleaved block.
+        sources = numpy.repeat(
+            numpy.arange(synapse_info.n_pre_neurons, dtype=uint32),
+            n_in_slice)
+        targets = post_neurons[in_slice]
+
+        # Set up the block; every field is written, so it need not be zeroed
+        block = numpy.empty(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        pre_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            for pn in self._post_neurons_in_slice(
-                    post_vertex_slice, n, synapse_info):
-                post_neurons_in_slice.append(pn)
-                pre_neurons_in_slice.append(pre_vertex_array[n - lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = sources
+        block["target"] = targets
         block["weight"] = self._generate_weights(
-            block["source"], block["target"], n_connections, post_vertex_slice,
-            synapse_info)
+            sources, targets, n_connections, post_vertex_slice, synapse_info)
         block["delay"] = self._generate_delays(
-            block["source"], block["target"], n_connections, post_vertex_slice,
-            synapse_info)
+            sources, targets, n_connections, post_vertex_slice, synapse_info)
         block["synapse_type"] = synapse_type
         return block
 
@@ -328,10 +531,17 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         allow_self = (
             self.__allow_self_connections or
             synapse_info.pre_population != synapse_info.post_population)
-        return numpy.array([
-            int(allow_self),
-            int(self.__with_replacement),
-            self.__n_post], dtype=uint32)
+        # The parameters only vary with allow_self, so keep one read-only
+        # copy of each
+        params = self.__gen_params.get(allow_self)
+        if params is None:
+            params = numpy.array([
+                int(allow_self),
+                int(self.__with_replacement),
+                self.__n_post], dtype=uint32)
+            params.setflags(write=False)
+            self.__gen_params[allow_self] = params
+        return params
 
     @property
     @overrides(
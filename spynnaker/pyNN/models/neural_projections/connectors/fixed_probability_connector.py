@@ -23,6 +23,7 @@ from pyNN.random import NumpyRNG
 
 from spinn_utilities.overrides import overrides
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.logger_utils import warn_once
 
 from pacman.model.graphs.common import Slice
 
@@ -30,6 +31,7 @@ from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
+from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.utilities.utility_calls import (
     get_probable_maximum_selected, get_probable_minimum_selected, check_rng)
 from .abstract_connector import AbstractConnector
@@ -77,7 +79,9 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
             Whether to output extra information about the connectivity to a
             CSV file
         :param rng:
-            Seeded random number generator, or `None` to make one when needed
+            Seeded random number generator, or `None` to use the generator
+            shared through
+            :py:meth:`~spynnaker.pyNN.data.SpynnakerDataView.get_rng`
         :type rng: ~pyNN.random.NumpyRNG or None
         :param callable callback:
             if given, a callable that display a progress bar on the terminal.
@@ -86,13 +90,14 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
                 Not supported by sPyNNaker.
         """
         # Support 1.0 by using maximum U032.  Warn the user because this isn't
-        # *quite* the same
+        # *quite* the same, but only once as many connectors may be made
         if p_connect == 1.0:
             p_connect = float(DataType.U032.max)
-            logger.warning(
+            warn_once(
+                logger,
                 "Probability of 1.0 in the FixedProbabilityConnector will use "
-                "{} instead.  If this is a problem, use the AllToAllConnector "
-                "instead.", p_connect)
+                f"{p_connect} instead.  If this is a problem, use the "
+                "AllToAllConnector instead.")
         if not 0.0 <= p_connect < 1.0:
             raise ConfigurationException(
                 "The probability must be >= 0 and < 1")
@@ -158,9 +163,11 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
     def create_synaptic_block(
             self, post_slices: Sequence[Slice], post_vertex_slice: Slice,
             synapse_type: int, synapse_info: SynapseInformation) -> NDArray:
-        rng = self.__rng or NumpyRNG()
         n_items = synapse_info.n_pre_neurons * post_vertex_slice.n_atoms
-        items = rng.next(n_items)
+        if self.__rng is None:
+            items = SpynnakerDataView.get_rng().random(n_items)
+        else:
+            items = self.__rng.next(n_items)
 
         # If self connections are not allowed, remove possibility the self
         # connections by setting them to a value of infinity
@@ -20,7 +20,7 @@ from typing import (
     Optional, Tuple, Union, cast, TYPE_CHECKING)
 
 import numpy
-from numpy import integer, floating, float64, uint16, uint32
+from numpy import integer, floating, float64, int16, uint32
 from numpy.typing import ArrayLike, NDArray
 
 from pyNN.random import RandomDistribution
@@ -362,5 +362,5 @@ class PoolDenseConnector(AbstractConnector):
         pos_weights = weights > 0
         weights[neg_weights] *= weight_scales[neg_synapse_type]
         weights[pos_weights] *= weight_scales[pos_synapse_type]
-        all_data.append(numpy.round(weights).astype(uint16).view(uint32))
+        all_data.append(numpy.round(weights).astype(int16).view(uint32))
         return numpy.concatenate(all_data)
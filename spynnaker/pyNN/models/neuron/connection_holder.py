@@ -18,7 +18,7 @@ from typing import (
 import numpy
 from numpy.lib.recfunctions import merge_arrays
 from numpy.typing import NDArray
-from typing_extensions import TypeAlias, TypeGuard
+from typing_extensions import TypeAlias
 
 from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
     ConnectionsArray)
@@ -27,10 +27,6 @@ _ItemType: TypeAlias = numpy.floating
 _Items: TypeAlias = Union[Tuple[NDArray[_ItemType], ...], NDArray[_ItemType]]
 
 
-def _is_listable(value: Any) -> TypeGuard[Sequence[Any]]:
-    return hasattr(value, "__len__")
-
-
 class ConnectionHolder(object):
     """
     Holds a set of connections to be returned in a PyNN-specific format.
@@ -205,13 +201,11 @@ class ConnectionHolder(object):
                     connections[order][self.__data_items_to_return[0]]
 
             # Return in a format which can be understood by a FromListConnector
-            items: List[Any] = []
+            # with numpy converting all the rows to Python values in one go
             # NB: The types in here are all wrong, but that's
-            for data_item in data_items:
-                if _is_listable(data_item):
-                    items.append(list(data_item))
-                else:
-                    items.append(data_item)
+            items: List[Any] = data_items.tolist()
+            if data_items.dtype.names is not None:
+                items = [list(item) for item in items]
             self.__data_items = tuple(items)
 
         else:
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from math import ceil
 from typing import (
     Dict, Iterable, List, Tuple, cast, TYPE_CHECKING)
 
@@ -194,8 +193,10 @@ class LocalOnlyConvolution(AbstractLocalOnly, AbstractSupportsSignedWeights):
 
             # Get cores per width / height
             pre_shape = list(pre_vertex.atoms_shape)
-            cores_per_width = int(ceil(pre_shape[0] / width_per_core))
-            cores_per_height = int(ceil(pre_shape[1] / height_per_core))
+            cores_per_width = (
+                pre_shape[0] + width_per_core - 1) // width_per_core
+            cores_per_height = (
+                pre_shape[1] + height_per_core - 1) // height_per_core
 
             # Add the key and mask...
             source_data.extend([r_info.key, r_info.mask])
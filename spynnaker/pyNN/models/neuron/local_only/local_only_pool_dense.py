@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from math import ceil
+import math
 from typing import (
-    Dict, List, Iterable, Tuple, cast, TYPE_CHECKING)
+    Dict, List, Iterable, NamedTuple, Tuple, cast, TYPE_CHECKING)
 
 import numpy
 from numpy import floating, uint32
@@ -58,6 +58,36 @@ SOURCE_INFO_DIM_SIZE = 9 * BYTES_PER_WORD
 #: Size of information
 CONFIG_SIZE = 3 * BYTES_PER_WORD
 
+# The source information sizes in words
+_SOURCE_INFO_WORDS = SOURCE_INFO_SIZE // BYTES_PER_WORD
+_SOURCE_INFO_DIM_WORDS = SOURCE_INFO_DIM_SIZE // BYTES_PER_WORD
+
+# The number of bits of the start connector index in the key information
+_START_BITS = BITS_PER_SHORT - N_COLOUR_BITS_BITS
+
+
+class _WeightStats(NamedTuple):
+    """
+    The statistics of the weights of a connector.
+    """
+    maximum_positive: float
+    minimum_negative: float
+    mean_positive: float
+    mean_negative: float
+    variance_positive: float
+    variance_negative: float
+
+
+class _ProjectionPlan(NamedTuple):
+    """
+    The parts of the parameters of a set of incoming projections that do not
+    depend on the number of atoms.
+    """
+    #: The size of the source information of all the sources
+    source_bytes: int
+    #: The connector and source shape of each projection
+    connectors: List[Tuple[PoolDenseConnector, Tuple[int, ...]]]
+
 
 class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
     """
@@ -65,16 +95,36 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
     """
 
     __slots__ = [
-        "__cached_sources"]
+        "__cached_sources",
+        "__cached_sizes",
+        "__cached_plans",
+        "__cached_dim_data",
+        "__cached_weight_stats"]
 
     def __init__(self, delay: Weight_Delay_In_Types = None):
         """
         :param float delay:
             The delay used in the connection; by default 1 time step
         """
-        # Store the sources to avoid recalculation
+        # Store the sources to avoid recalculation.  None of the caches are
+        # locked, as the data specifications are generated on one thread.
         self.__cached_sources: Dict[ApplicationVertex, Dict[
                 Tuple[ApplicationVertex, str], List[Source]]] = dict()
+        # Store the region sizes of each set of incoming projections and
+        # number of atoms to avoid recalculation for each core
+        self.__cached_sizes: Dict[
+            Tuple[Tuple[Projection, ...], int], int] = dict()
+        # Store the checked connectors of each set of incoming projections,
+        # which is the same whatever the number of atoms
+        self.__cached_plans: Dict[
+            Tuple[Projection, ...], _ProjectionPlan] = dict()
+        # Store the per-dimension source words of each set of source and core
+        # shapes, which are the same for every core the source targets
+        self.__cached_dim_data: Dict[Tuple[Tuple[int, ...], ...],
+                                     NDArray[uint32]] = dict()
+        # Store the weight statistics of each connector, which can't change
+        self.__cached_weight_stats: Dict[
+            PoolDenseConnector, _WeightStats] = dict()
 
         super().__init__(delay)
         if not isinstance(self.delay, (float, int)):
@@ -114,7 +164,25 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
     def get_parameters_usage_in_bytes(
             self, n_atoms: int,
             incoming_projections: Iterable[Projection]) -> int:
-        n_bytes = 0
+        plan = self.__plan(tuple(incoming_projections))
+        return CONFIG_SIZE + plan.source_bytes + sum(
+            conn.local_only_n_bytes(pre_shape, n_atoms)
+            for conn, pre_shape in plan.connectors)
+
+    def __plan(self, incoming_projections: Tuple[Projection, ...]
+               ) -> _ProjectionPlan:
+        """
+        Check the connectors of the incoming projections and work out the
+        parts of the parameters that don't depend on the number of atoms.
+
+        :param tuple(Projection) incoming_projections:
+        :rtype: _ProjectionPlan
+        """
+        plan = self.__cached_plans.get(incoming_projections)
+        if plan is not None:
+            return plan
+        source_bytes = 0
+        connectors: List[Tuple[PoolDenseConnector, Tuple[int, ...]]] = list()
         seen_edges = set()
         for incoming in incoming_projections:
             # pylint: disable=protected-access
@@ -125,15 +193,15 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
                     " of PoolDense")
             # pylint: disable=protected-access
             app_edge = incoming._projection_edge
+            pre_shape = app_edge.pre_vertex.atoms_shape
             if app_edge not in seen_edges:
                 seen_edges.add(app_edge)
-                n_dims = len(app_edge.pre_vertex.atoms_shape)
-                n_bytes += SOURCE_INFO_SIZE
-                n_bytes += n_dims * SOURCE_INFO_DIM_SIZE
-            n_bytes += s_info.connector.local_only_n_bytes(
-                app_edge.pre_vertex.atoms_shape, n_atoms)
-
-        return CONFIG_SIZE + n_bytes
+                source_bytes += SOURCE_INFO_SIZE
+                source_bytes += len(pre_shape) * SOURCE_INFO_DIM_SIZE
+            connectors.append((s_info.connector, pre_shape))
+        plan = _ProjectionPlan(source_bytes, connectors)
+        self.__cached_plans[incoming_projections] = plan
+        return plan
 
     @overrides(AbstractLocalOnly.write_parameters)
     def write_parameters(
@@ -143,86 +211,163 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
         # Get incoming sources for this vertex
         app_vertex = cast('AbstractPopulationVertex',
                           machine_vertex.app_vertex)
+        vertex_slice = machine_vertex.vertex_slice
         sources = self.__get_sources_for_target(app_vertex)
 
-        size = self.get_parameters_usage_in_bytes(
-            machine_vertex.vertex_slice.n_atoms,
-            app_vertex.incoming_projections)
+        size = self.__get_parameters_size(app_vertex, vertex_slice.n_atoms)
         spec.reserve_memory_region(region, size, label="LocalOnlyPoolDense")
         spec.switch_write_focus(region)
 
+        # Most of the source data is the same whichever core is targeted, so
+        # it is copied in with the connectors of this core, and then the
+        # connectors of each source are filled in
+        all_source_data = [
+            self.__get_source_data(pre_vertex, part_id)
+            for pre_vertex, part_id in sources]
         connector_data: List[NDArray[uint32]] = list()
-        source_data = list()
-        n_connectors = 0
-        for (pre_vertex, part_id), source_infos in sources.items():
+        key_info_indices: List[int] = list()
+        key_info_values: List[int] = list()
+        index = 0
+        for source_infos, source_words in zip(
+                sources.values(), all_source_data):
             first_conn_index = len(connector_data)
             for source in source_infos:
                 # pylint: disable=protected-access
-                conn = source.projection._synapse_information.connector
-                app_edge = source.projection._projection_edge
+                proj = source.projection
+                conn = proj._synapse_information.connector
                 connector_data.append(conn.get_local_only_data(
-                    app_edge, source.local_delay, source.delay_stage,
-                    machine_vertex.vertex_slice, weight_scales))
-                n_connectors += 1
-
-            # Get the source routing information
-            r_info, core_mask, mask_shift = get_rinfo_for_spike_source(
-                pre_vertex, part_id)
-
-            # Get the width / height per core / last_core
-            first_slice, last_slice = get_first_and_last_slice(pre_vertex)
-            n_dims = len(pre_vertex.atoms_shape)
-            pre_shape = list(pre_vertex.atoms_shape)
-
-            # Add the key and mask...
-            source_data.extend([r_info.key, r_info.mask])
-            # ... start connector index, n_colour_bits, count of connectors ...
-            source_data.append(
-                (len(source_infos) << BITS_PER_SHORT) +
-                (pre_vertex.n_colour_bits <<
-                 (BITS_PER_SHORT - N_COLOUR_BITS_BITS)) +
-                first_conn_index)
-            # ... core mask, mask shift ...
-            source_data.append((mask_shift << BITS_PER_SHORT) + core_mask)
-            # ... n_dims ...
-            source_data.append(n_dims)
-
-            # Add the dimensions; calculations are in reverse order!
-            cum_size = 1
-            cum_cores_per_dim = 1
-            cum_last_size = 1
-            all_dim_data = list()
-            for i in range(n_dims):
-                dim_data = list()
-                # Size per core
-                dim_data.append(first_slice.shape[i])
-                dim_data.append(cum_size)
-                dim_data.append(get_div_const(cum_size))
-                cum_size *= first_slice.shape[i]
-
-                # Cores
-                cores_per_dim = int(ceil(pre_shape[i] / first_slice.shape[i]))
-                dim_data.append(cores_per_dim)
-                dim_data.append(cum_cores_per_dim)
-                dim_data.append(get_div_const(cum_cores_per_dim))
-                cum_cores_per_dim *= cores_per_dim
-
-                # Last core
-                dim_data.append(last_slice.shape[i])
-                dim_data.append(cum_last_size)
-                dim_data.append(get_div_const(cum_last_size))
-                cum_last_size *= last_slice.shape[i]
-                all_dim_data.append(dim_data)
-            for dim_data in reversed(all_dim_data):
-                source_data.extend(dim_data)
+                    proj._projection_edge, source.local_delay,
+                    source.delay_stage, vertex_slice, weight_scales))
+
+            # Add the count of connectors and start connector index to the
+            # n_colour_bits, making sure that each fits in its field
+            if len(source_infos) >> BITS_PER_SHORT:
+                raise SynapticConfigurationException(
+                    f"Too many connectors ({len(source_infos)}) from source"
+                    f" to fit in {BITS_PER_SHORT} bits")
+            if first_conn_index >> _START_BITS:
+                raise SynapticConfigurationException(
+                    f"Too many connectors ({first_conn_index}) before source"
+                    f" to fit in {_START_BITS} bits")
+            key_info_indices.append(index + 2)
+            key_info_values.append(
+                (len(source_infos) << BITS_PER_SHORT) | first_conn_index)
+            index += len(source_words)
+
+        # All the data is copied into one array in one go
+        data = numpy.concatenate(
+            all_source_data + connector_data, dtype=uint32)
+        data[key_info_indices] |= numpy.array(key_info_values, dtype=uint32)
 
         # Write the spec
-        n_post = int(numpy.prod(machine_vertex.vertex_slice.shape))
+        n_post = math.prod(vertex_slice.shape)
         spec.write_value(n_post, data_type=DataType.UINT32)
         spec.write_value(len(sources), data_type=DataType.UINT32)
-        spec.write_value(n_connectors, data_type=DataType.UINT32)
-        spec.write_array(numpy.array(source_data, dtype=numpy.uint32))
-        spec.write_array(numpy.concatenate(connector_data))
+        spec.write_value(len(connector_data), data_type=DataType.UINT32)
+        spec.write_array(data)
+
+    def __get_source_data(
+            self, pre_vertex: ApplicationVertex,
+            part_id: str) -> NDArray[uint32]:
+        """
+        Get the words of a source that are the same for every target, as they
+        are written; the count of connectors and start connector index are
+        left for the target to add in.
+
+        :param ApplicationVertex pre_vertex: The source vertex
+        :param str part_id: The partition of the source
+        :rtype: ~numpy.ndarray
+        """
+        # Get the source routing information; this is read each time as the
+        # keys can change when the graph is changed and run again
+        r_info, core_mask, mask_shift = get_rinfo_for_spike_source(
+            pre_vertex, part_id)
+        if pre_vertex.n_colour_bits >> N_COLOUR_BITS_BITS:
+            raise SynapticConfigurationException(
+                f"Too many colour bits ({pre_vertex.n_colour_bits}) in"
+                f" {pre_vertex} to fit in {N_COLOUR_BITS_BITS} bits")
+        dim_data = self.__get_dim_data(pre_vertex)
+        data = numpy.empty(_SOURCE_INFO_WORDS + len(dim_data), dtype=uint32)
+
+        # Add the key and mask...
+        data[:_SOURCE_INFO_WORDS] = (
+            r_info.key, r_info.mask,
+            # ... n_colour_bits ...
+            pre_vertex.n_colour_bits << _START_BITS,
+            # ... core mask, mask shift ...
+            (mask_shift << BITS_PER_SHORT) | core_mask,
+            # ... n_dims ...
+            len(pre_vertex.atoms_shape))
+
+        # Add the dimensions
+        data[_SOURCE_INFO_WORDS:] = dim_data
+        return data
+
+    def __get_dim_data(self, pre_vertex: ApplicationVertex) -> NDArray[uint32]:
+        """
+        Get the per-dimension words of a source, as they are written.  These
+        only depend on the shapes of the source and of its first and last
+        cores, so are remembered for those shapes.
+
+        :param ApplicationVertex pre_vertex: The source vertex
+        :rtype: ~numpy.ndarray
+        """
+        first_slice, last_slice = get_first_and_last_slice(pre_vertex)
+        key = (tuple(pre_vertex.atoms_shape), first_slice.shape,
+               last_slice.shape)
+        dim_data = self.__cached_dim_data.get(key)
+        if dim_data is None:
+            # Calculations are in reverse order!
+            dim_data = self.__make_dim_data(*key)[::-1].ravel()
+            dim_data.setflags(write=False)
+            self.__cached_dim_data[key] = dim_data
+        return dim_data
+
+    @staticmethod
+    def __make_dim_data(
+            pre_shape: Tuple[int, ...], first_shape: Tuple[int, ...],
+            last_shape: Tuple[int, ...]) -> NDArray[uint32]:
+        """
+        Work out the per-dimension information of a source, one row for each
+        dimension in order.
+
+        :param tuple(int) pre_shape: The shape of the source vertex
+        :param tuple(int) first_shape: The shape of the first core
+        :param tuple(int) last_shape: The shape of the last core
+        :rtype: ~numpy.ndarray
+        """
+        # Get the width / height per core / last_core
+        size = numpy.array(first_shape, dtype=uint32)
+        last_size = numpy.array(last_shape, dtype=uint32)
+        cores_per_dim = (
+            numpy.array(pre_shape, dtype=uint32) + size - 1) // size
+
+        # The products of the sizes of the dimensions before each one
+        cum_size = numpy.ones_like(size)
+        numpy.cumprod(size[:-1], out=cum_size[1:])
+        cum_cores_per_dim = numpy.ones_like(size)
+        numpy.cumprod(cores_per_dim[:-1], out=cum_cores_per_dim[1:])
+        cum_last_size = numpy.ones_like(size)
+        numpy.cumprod(last_size[:-1], out=cum_last_size[1:])
+
+        return numpy.column_stack((
+            size, cum_size, LocalOnlyPoolDense.__div_consts(cum_size),
+            cores_per_dim, cum_cores_per_dim,
+            LocalOnlyPoolDense.__div_consts(cum_cores_per_dim),
+            last_size, cum_last_size,
+            LocalOnlyPoolDense.__div_consts(cum_last_size)))
+
+    @staticmethod
+    def __div_consts(values: NDArray[uint32]) -> NDArray[uint32]:
+        """
+        Get the division constants of each of the values.
+
+        :param ~numpy.ndarray values:
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.fromiter(
+            map(get_div_const, values.tolist()), dtype=uint32,
+            count=len(values))
 
     def __get_sources_for_target(self, app_vertex: AbstractPopulationVertex):
         """
@@ -241,6 +386,24 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
             self.__cached_sources[app_vertex] = sources
         return sources
 
+    def __get_parameters_size(
+            self, app_vertex: AbstractPopulationVertex, n_atoms: int) -> int:
+        """
+        Get the size of the parameters of a core of the given application
+        vertex; this is the same for all cores with the same number of atoms
+        and the same incoming projections.
+
+        :param AbstractPopulationVertex app_vertex: The vertex being targeted
+        :param int n_atoms: The number of atoms on the core
+        :rtype: int
+        """
+        key = (tuple(app_vertex.incoming_projections), n_atoms)
+        size = self.__cached_sizes.get(key)
+        if size is None:
+            size = self.get_parameters_usage_in_bytes(n_atoms, key[0])
+            self.__cached_sizes[key] = size
+        return size
+
     @staticmethod
     def __get_synapse_type(proj: Projection, target: str) -> int:
         edge = proj._projection_edge  # pylint: disable=protected-access
@@ -263,66 +426,69 @@ class LocalOnlyPoolDense(AbstractLocalOnly, AbstractSupportsSignedWeights):
             incoming_projection,
             self.__connector(incoming_projection).negative_receptor_type)
 
+    def __weight_stats(self, incoming_projection: Projection) -> _WeightStats:
+        """
+        Get the statistics of the weights of the connector of a projection,
+        working them all out the first time any is asked for.
+
+        :param Projection incoming_projection:
+        :rtype: _WeightStats
+        """
+        conn = self.__connector(incoming_projection)
+        stats = self.__cached_weight_stats.get(conn)
+        if stats is None and conn.weights.size <= 1:
+            # A single weight (or none) is its own maximum and mean
+            weight = conn.weights.item() if conn.weights.size else 0
+            stats = _WeightStats(
+                max(weight, 0), min(weight, 0), max(weight, 0),
+                min(weight, 0), 0, 0)
+            self.__cached_weight_stats[conn] = stats
+        if stats is None:
+            weights = conn.weights
+            max_weight = numpy.amax(weights)
+            min_weight = numpy.amin(weights)
+            # Reduce over the positive and negative weights where they are,
+            # rather than copying each out into a new array
+            is_pos = weights > 0
+            is_neg = weights < 0
+            has_pos = numpy.any(is_pos)
+            has_neg = numpy.any(is_neg)
+            stats = _WeightStats(
+                max_weight if max_weight > 0 else 0,
+                min_weight if min_weight < 0 else 0,
+                numpy.mean(weights, where=is_pos) if has_pos else 0,
+                numpy.mean(weights, where=is_neg) if has_neg else 0,
+                numpy.var(weights, where=is_pos) if has_pos else 0,
+                numpy.var(weights, where=is_neg) if has_neg else 0)
+            self.__cached_weight_stats[conn] = stats
+        return stats
+
     @overrides(AbstractSupportsSignedWeights.get_maximum_positive_weight)
     def get_maximum_positive_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        # We know the connector doesn't care about the argument
-        max_weight = numpy.amax(conn.weights)
-        return max_weight if max_weight > 0 else 0
+        return self.__weight_stats(incoming_projection).maximum_positive
 
     @overrides(AbstractSupportsSignedWeights.get_minimum_negative_weight)
     def get_minimum_negative_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        # This is different because the connector happens to support this
-        min_weight = numpy.amin(conn.weights)
-        return min_weight if min_weight < 0 else 0
+        return self.__weight_stats(incoming_projection).minimum_negative
 
     @overrides(AbstractSupportsSignedWeights.get_mean_positive_weight)
     def get_mean_positive_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        weights = conn.weights
-        if isinstance(weights, (int, float)):
-            return weights
-        pos_weights = weights[weights > 0]
-        if len(pos_weights) == 0:
-            return 0
-        return numpy.mean(pos_weights)
+        return self.__weight_stats(incoming_projection).mean_positive
 
     @overrides(AbstractSupportsSignedWeights.get_mean_negative_weight)
     def get_mean_negative_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        weights = conn.weights
-        if isinstance(weights, (int, float)):
-            return weights
-        neg_weights = weights[weights < 0]
-        if len(neg_weights) == 0:
-            return 0
-        return numpy.mean(neg_weights)
+        return self.__weight_stats(incoming_projection).mean_negative
 
     @overrides(AbstractSupportsSignedWeights.get_variance_positive_weight)
     def get_variance_positive_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        weights = conn.weights
-        if isinstance(weights, (int, float)):
-            return 0
-        pos_weights = weights[weights > 0]
-        if len(pos_weights) == 0:
-            return 0
-        return numpy.var(pos_weights)
+        return self.__weight_stats(incoming_projection).variance_positive
 
     @overrides(AbstractSupportsSignedWeights.get_variance_negative_weight)
     def get_variance_negative_weight(
             self, incoming_projection: Projection) -> float:
-        conn = self.__connector(incoming_projection)
-        weights = conn.weights
-        if isinstance(weights, (int, float)):
-            return 0
-        neg_weights = weights[weights < 0]
-        if len(neg_weights) == 0:
-            return 0
-        return numpy.var(neg_weights)
+        return self.__weight_stats(incoming_projection).variance_negative
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 import math
 import numpy
 from numpy import uint16, uint32
@@ -29,9 +30,16 @@ def float_to_fixed(value: float) -> int:
     return int(round(float(value) * STDP_FIXED_POINT_ONE))
 
 
+@lru_cache(maxsize=256)
 def get_exp_lut_array(time_step: float, time_constant: float,
                       shift: int = 0) -> NDArray[uint32]:
     """
+    Get the exponential decay lookup table for a time constant.
+
+    .. note::
+        The table is shared between all callers with the same arguments,
+        so it is returned read-only.
+
     :param float time_step:
     :param float time_constant:
     :param int shift:
@@ -52,4 +60,6 @@ def get_exp_lut_array(time_step: float, time_constant: float,
 
     # Concatenate with the header
     header = numpy.array([len(a), shift], dtype=uint16)
-    return numpy.concatenate((header, a.astype(uint16))).view(uint32)
+    lut = numpy.concatenate((header, a.astype(uint16))).view(uint32)
+    lut.setflags(write=False)
+    return lut
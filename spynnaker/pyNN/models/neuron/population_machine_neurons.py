@@ -14,10 +14,13 @@
 from __future__ import annotations
 from collections.abc import Container
 import ctypes
+from itertools import chain
 from typing import (
     List, NamedTuple, Sequence, Set, Union, Optional, cast, TYPE_CHECKING)
 
 import numpy
+from numpy import uint32
+from numpy.typing import NDArray
 
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
@@ -37,7 +40,7 @@ from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
 from spynnaker.pyNN.models.abstract_models import AbstractNeuronExpandable
 from spynnaker.pyNN.models.current_sources import CurrentSourceIDs
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import convert_all_to
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
     from spynnaker.pyNN.models.neuron.neuron_data import NeuronData
@@ -376,20 +379,15 @@ class PopulationMachineNeurons(
                 # of the same type is also used
                 cs_index_array[cs_id] += 1
 
-            # Now loop over the neurons on this core and write the current
-            # source ID and index for sources attached to each neuron
-            for n in range(n_atoms):
-                n_current_sources = neuron_current_sources[n][0]
-                spec.write_value(n_current_sources)
-                if n_current_sources != 0:
-                    for csid in range(n_current_sources * 2):
-                        spec.write_value(neuron_current_sources[n][csid+1])
+            # Now add the current source ID and index for sources attached
+            # to each neuron on this core
+            cs_data: List[NDArray[uint32]] = [numpy.fromiter(
+                chain.from_iterable(neuron_current_sources), dtype=uint32)]
 
-            # Write the number of each type of current source
-            for n in range(1, len(cs_index_array)):
-                spec.write_value(cs_index_array[n])
+            # Add the number of each type of current source
+            cs_data.append(numpy.array(cs_index_array[1:], dtype=uint32))
 
-            # Now loop over the current sources and write the data required
+            # Now loop over the current sources and add the data required
             # for each type of current source
             for current_source in current_sources:
                 cs_data_types = current_source.parameter_types
@@ -398,24 +396,19 @@ class PopulationMachineNeurons(
                     # StepCurrentSource currently handled with arrays
                     if cs_id == CurrentSourceIDs.STEP_CURRENT_SOURCE.value:
                         assert isinstance(value, Sequence)
-                        n_params = len(value)
-                        spec.write_value(n_params)
-                        for n_p in range(n_params):
-                            value_convert = convert_to(
-                                value[n_p], cs_data_types[key]).view("uint32")
-                            spec.write_value(data=value_convert)
+                        cs_data.append(numpy.array([len(value)], dtype=uint32))
+                        cs_data.append(convert_all_to(
+                            value, cs_data_types[key]).view(uint32))
                     # All other sources have single-valued params
+                    elif isinstance(value, Sequence):
+                        cs_data.append(convert_all_to(
+                            value, cs_data_types[key]).view(uint32))
                     else:
-                        if isinstance(value, Sequence):
-                            for a_value in value:
-                                value_convert = convert_to(
-                                    a_value,
-                                    cs_data_types[key]).item()
-                                spec.write_value(data=value_convert)
-                        else:
-                            value_convert = convert_to(
-                                value, cs_data_types[key]).item()
-                            spec.write_value(data=value_convert)
+                        cs_data.append(convert_all_to(
+                            [value], cs_data_types[key]).view(uint32))
+
+            # Write it all in one go
+            spec.write_array(numpy.concatenate(cs_data))
 
     def __get_current_sources_sorted(self) -> List[AbstractCurrentSource]:
         app_current_sources = self._pop_vertex.current_sources
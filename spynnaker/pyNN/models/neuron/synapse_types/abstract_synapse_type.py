@@ -11,11 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence, Type
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spynnaker.pyNN.models.neuron.implementations import (
     AbstractStandardNeuronComponent)
 
+# The IDs of the targets of each class of synapse type, by name
+_TARGET_IDS: Dict[Type["AbstractSynapseType"], Dict[str, int]] = dict()
+
 
 class AbstractSynapseType(
         AbstractStandardNeuronComponent, metaclass=AbstractBase):
@@ -35,15 +38,24 @@ class AbstractSynapseType(
         """
         raise NotImplementedError
 
-    @abstractmethod
     def get_synapse_id_by_target(self, target: str) -> Optional[int]:
         """
         Get the ID of a synapse given the name.
 
-        :return: The ID of the synapse
-        :rtype: int
+        By default this is the position of the name in
+        :py:meth:`get_synapse_targets`, which is assumed to be the same for
+        all synapse types of a class.
+
+        :return: The ID of the synapse, or `None` if there is no such target
+        :rtype: int or None
         """
-        raise NotImplementedError
+        target_ids = _TARGET_IDS.get(type(self))
+        if target_ids is None:
+            target_ids = dict()
+            for synapse_id, name in enumerate(self.get_synapse_targets()):
+                target_ids.setdefault(name, synapse_id)
+            _TARGET_IDS[type(self)] = target_ids
+        return target_ids.get(target)
 
     @abstractmethod
     def get_synapse_targets(self) -> Sequence[str]:
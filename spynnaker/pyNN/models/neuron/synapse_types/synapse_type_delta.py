@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Tuple
+from typing import Tuple
 
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged import RangeDictionary
@@ -65,14 +65,6 @@ class SynapseTypeDelta(AbstractSynapseType):
     def get_n_synapse_types(self) -> int:
         return 2
 
-    @overrides(AbstractSynapseType.get_synapse_id_by_target)
-    def get_synapse_id_by_target(self, target: str) -> Optional[int]:
-        if target == "excitatory":
-            return 0
-        elif target == "inhibitory":
-            return 1
-        return None
-
     @overrides(AbstractSynapseType.get_synapse_targets)
     def get_synapse_targets(self) -> Tuple[str, ...]:
         return "excitatory", "inhibitory"
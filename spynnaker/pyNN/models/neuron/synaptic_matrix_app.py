@@ -394,10 +394,11 @@ class SynapticMatrixApp(object):
             Where the matrix is on the machine
         """
         if self.__synapse_info.pre_run_connection_holders:
+            # The holders join the blocks once when the data is asked for, so
+            # there is no need to join them here as well
             connections = self.get_connections(placement)
-            if connections:
-                conns = numpy.concatenate(connections)
-                for holder in self.__synapse_info.pre_run_connection_holders:
+            for holder in self.__synapse_info.pre_run_connection_holders:
+                for conns in connections:
                     holder.add_connections(conns)
 
     def get_connections(self, placement: Placement) -> List[NDArray]:
@@ -19,7 +19,8 @@ from typing import (
     cast, TYPE_CHECKING)
 
 import numpy
-from numpy import void
+from numpy import float64, void
+from numpy.lib.recfunctions import structured_to_unstructured
 from numpy.typing import NDArray
 from typing_extensions import Literal, TypeAlias
 
@@ -110,18 +111,13 @@ class Projection(object):
         pre_is_view = self.__check_population(pre_synaptic_population)
         post_is_view = self.__check_population(post_synaptic_population)
 
-        # set default label
+        # set default label; if None the projection's label is made from the
+        # populations and connector when first asked for
+        self.__label = label
         if label is None:
-            # set the projection's label to a default (maybe non-unique!)
-            self.__label = (
-                f"from pre {pre_synaptic_population.label} "
-                f"to post {post_synaptic_population.label} "
-                f"with connector {connector}")
             # give an auto generated label for the underlying edge
             label = f"projection edge " \
                     f"{SpynnakerDataView.get_next_none_labelled_edge_number()}"
-        else:
-            self.__label = label
 
         # Handle default synapse type
         if synapse_type is None:
@@ -187,7 +183,7 @@ class Projection(object):
             self.__projection_edge = ProjectionApplicationEdge(
                 pre_vertex, post_vertex, self.__synapse_information,
                 label=label)
-            SpynnakerDataView.add_edge(
+            SpynnakerDataView.add_projection_edge(
                 self.__projection_edge,
                 self.__synapse_information.partition_id)
 
@@ -375,11 +371,15 @@ class Projection(object):
         :param data:
         :type data: ConnectionHolder or numpy.ndarray
         """
-        # Convert structured array to normal numpy array
-        if hasattr(data, "dtype") and hasattr(data.dtype, "names"):
-            dtype = [(name, "<f8") for name in data.dtype.names]
-            data = data.astype(dtype)
-        npdata = numpy.nan_to_num(cast(NDArray, data))
+        # Convert to a new normal numpy array of floats, converting a
+        # structured array field by field; as the array is new, the NaNs
+        # can then be replaced in place
+        if hasattr(data, "dtype") and data.dtype.names is not None:
+            npdata = structured_to_unstructured(
+                cast(NDArray, data), dtype=float64)
+        else:
+            npdata = numpy.array(data, dtype=float64)
+        numpy.nan_to_num(npdata, copy=False)
         if isinstance(save_file, str):
             data_file = open(save_file, mode='wb')
         else:
@@ -418,10 +418,17 @@ class Projection(object):
         """
         :rtype: str
         """
+        if self.__label is None:
+            # set the projection's label to a default (maybe non-unique!)
+            s_info = self.__synapse_information
+            self.__label = (
+                f"from pre {s_info.pre_population.label} "
+                f"to post {s_info.post_population.label} "
+                f"with connector {s_info.connector}")
         return self.__label
 
     def __repr__(self):
-        return f"projection {self.__label}"
+        return f"projection {self.label}"
 
     # -----------------------------------------------------------------
 
@@ -444,8 +451,8 @@ class Projection(object):
             post_synaptic_vertex: ApplicationVertex,
             partition_id: str) -> Optional[ProjectionApplicationEdge]:
         """
-        Searches though the graph's edges to locate any
-        edge which has the same post- and pre- vertex
+        Looks up any edge of an earlier projection which has the same
+        post- and pre- vertex
 
         :param pre_synaptic_vertex: the source vertex of the multapse
         :type pre_synaptic_vertex:
@@ -457,20 +464,8 @@ class Projection(object):
         :return: `None` or the edge going to these vertices.
         :rtype: ~.ApplicationEdge
         """
-        # Find edges ending at the postsynaptic vertex
-        partitions = (
-            SpynnakerDataView.get_outgoing_edge_partitions_starting_at_vertex(
-                pre_synaptic_vertex))
-
-        # Partitions and Partition.edges will be OrderedSet but may be empty
-        for partition in partitions:
-            if partition.identifier != partition_id:
-                continue
-            for edge in partition.edges:
-                if edge.post_vertex == post_synaptic_vertex:
-                    return edge
-
-        return None
+        return SpynnakerDataView.get_projection_edge(
+            pre_synaptic_vertex, post_synaptic_vertex, partition_id)
 
     def _get_synaptic_data(
             self, as_list: bool, data_to_get: List[str],
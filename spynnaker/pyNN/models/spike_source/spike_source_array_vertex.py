@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from collections import Counter
 import logging
 from typing import (
     Collection, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING)
@@ -80,6 +79,23 @@ def _as_numpy_ticks(
         numpy.floor(numpy.array(times) * 1000.0) / time_step).astype("int64")
 
 
+def _all_spike_times(
+        spike_times: _DoubleList, n_atoms: int) -> NDArray:
+    # The spike times of the first n_atoms neurons as one flat array
+    return numpy.concatenate([
+        numpy.asarray(spike_times[neuron_id])
+        for neuron_id in range(n_atoms)])
+
+
+def _most_common(spike_times: ArrayLike) -> Tuple[_Number, int]:
+    # The most common spike time and how many times it appears
+    values, counts = numpy.unique(spike_times, return_counts=True)
+    if not len(counts):
+        return 0, 0
+    index = numpy.argmax(counts)
+    return values[index], int(counts[index])
+
+
 def _send_buffer_times(
         spike_times: Spikes, time_step: float) -> Union[
             NDArray[numpy.int64], List[NDArray[numpy.int64]]]:
@@ -169,9 +185,7 @@ class SpikeSourceArrayVertex(
             logger.warning("SpikeSourceArray has no spike times")
 
     def _check_density_single_list(self, spike_times: _SingleList):
-        counter = Counter(spike_times)
-        top = counter.most_common(1)
-        val, count = top[0]
+        val, count = _most_common(spike_times)
         if count * self.n_atoms > TOO_MANY_SPIKES:
             if self.n_atoms > 1:
                 logger.warning(
@@ -187,11 +201,8 @@ class SpikeSourceArrayVertex(
                     val, count * self.n_atoms)
 
     def _check_density_double_list(self, spike_times: _DoubleList):
-        counter: Counter = Counter()
-        for neuron_id in range(0, self.n_atoms):
-            counter.update(spike_times[neuron_id])
-        top = counter.most_common(1)
-        val, count = top[0]
+        val, count = _most_common(
+            _all_spike_times(spike_times, self.n_atoms))
         if count > TOO_MANY_SPIKES:
             logger.warning(
                 "Danger of SpikeSourceArray sending too many spikes "
@@ -219,14 +230,14 @@ class SpikeSourceArrayVertex(
         :param list(int) spike_times:
         """
         current_time = SpynnakerDataView.get_current_run_time_ms()
-        for spike_time in spike_times:
-            if spike_time < current_time:
-                logger.warning(
-                    "SpikeSourceArray {} has spike_times that are lower than "
-                    "the current time {} For example {} - "
-                    "these will be ignored.",
-                    self, current_time, float(spike_time))
-                return
+        times = numpy.asarray(spike_times)
+        early = times[times < current_time]
+        if len(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower than "
+                "the current time {} For example {} - "
+                "these will be ignored.",
+                self, current_time, float(early[0]))
 
     def _check_spikes_double_list(self, spike_times: _DoubleList):
         """
@@ -236,17 +247,8 @@ class SpikeSourceArrayVertex(
 
         :param iterable(int) spike_times:
         """
-        current_time = SpynnakerDataView.get_current_run_time_ms()
-        for neuron_id in range(0, self.n_atoms):
-            id_times = spike_times[neuron_id]
-            for id_time in id_times:
-                if id_time < current_time:
-                    logger.warning(
-                        "SpikeSourceArray {} has spike_times that are lower "
-                        "than the current time {} For example {} - "
-                        "these will be ignored.",
-                        self, current_time, float(id_time))
-                    return
+        self._to_early_spikes_single_list(
+            _all_spike_times(spike_times, self.n_atoms))
 
     def __set_spike_buffer_times(self, spike_times: Spikes):
         """
@@ -283,7 +283,7 @@ class SpikeSourcePoissonVertex(
         self.__data["durations"] = RangedList(
             n_neurons, _durations,
             use_list_as_value=not _is_list_of_lists(_durations))
-        self.__rng = numpy.random.RandomState(seed)
+        self.__rng = self.__make_rng(seed)
 
         self.__n_profile_samples = get_config_int(
             "Reports", "n_profile_samples")
@@ -601,7 +601,22 @@ class SpikeSourcePoissonVertex(
     def seed(self, seed: int):
         self.__seed = seed
         self.__kiss_seed = dict()
-        self.__rng = numpy.random.RandomState(seed)
+        self.__rng = self.__make_rng(seed)
+
+    @staticmethod
+    def __make_rng(seed: Optional[int]) -> Optional[numpy.random.RandomState]:
+        """
+        Make the generator of the KISS seeds from a seed; without a seed the
+        generator shared through SpynnakerDataView is used instead when the
+        KISS seeds are made.
+
+        :param seed:
+        :type seed: int or None
+        :rtype: ~numpy.random.RandomState or None
+        """
+        if seed is None:
+            return None
+        return numpy.random.RandomState(seed)
 
     def kiss_seed(self, vertex_slice: Slice) -> Tuple[int, ...]:
         """
@@ -615,7 +630,8 @@ class SpikeSourcePoissonVertex(
         :type: tuple(int)
         """
         if vertex_slice not in self.__kiss_seed:
-            self.__kiss_seed[vertex_slice] = create_mars_kiss_seeds(self.__rng)
+            self.__kiss_seed[vertex_slice] = create_mars_kiss_seeds(
+                self.__rng or SpynnakerDataView.get_rng())
         return self.__kiss_seed[vertex_slice]
 
     def update_kiss_seed(self, vertex_slice: Slice, seed: Sequence[int]):
@@ -30,7 +30,8 @@ from pacman.model.graphs.common import Slice
 from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_all_to)
 from spynnaker.pyNN.models.common.param_generator_data import (
     get_generator_type, param_generator_id, param_generator_params,
     type_has_generator)
@@ -201,8 +202,8 @@ class Struct(object):
             n_values = stop - start
             if isinstance(value, RandomDistribution):
                 r_vals = value.next(n_values)
-                data[name][data_pos:data_pos + n_values] = [
-                    convert_to(v, data_type) for v in r_vals]
+                data[name][data_pos:data_pos + n_values] = convert_all_to(
+                    r_vals, data_type)
             else:
                 data[name][data_pos:data_pos + n_values] = convert_to(
                     value, data_type)
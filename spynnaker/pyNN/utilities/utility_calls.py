@@ -18,12 +18,14 @@ Utility package containing simple helper functions.
 import logging
 import os
 import math
+from functools import lru_cache
 from math import isnan
-from typing import List, Tuple
+from typing import Iterable, List, Tuple, Union
 
 import neo
 import numpy
-from numpy import uint32, floating
+from numpy import float64, int64, uint32, uint64, floating
+from numpy.random import Generator, RandomState
 from numpy.typing import NDArray
 from pyNN.random import RandomDistribution
 from scipy.stats import binom
@@ -131,6 +133,32 @@ def convert_to(value, data_type: DataType) -> uint32:
         data_type.struct_encoding)
 
 
+def convert_all_to(values: Iterable, data_type: DataType) -> NDArray:
+    """
+    Convert values to a given data type; this gives the same as calling
+    :py:func:`convert_to` on each value, but does the rounding and casting
+    for all the values at once.
+
+    :param iterable values: The values to convert
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :return: The converted data as a numpy array
+    :rtype: ~numpy.ndarray
+    """
+    encoding = numpy.dtype(data_type.struct_encoding)
+    # Hold the encoded values in a type wide enough for all of them
+    if encoding.kind == "f":
+        wide_type = float64
+    elif encoding == uint64:
+        wide_type = uint64
+    else:
+        wide_type = int64
+    encoded = numpy.array(
+        [data_type.encode_as_int(value) for value in values],
+        dtype=wide_type)
+    return numpy.round(encoded).astype(encoding)
+
+
 def read_in_data_from_file(
         file_path: str, min_atom: int, max_atom: int,
         min_time: float, max_time: float, extra: bool = False) -> NDArray:
@@ -233,12 +261,17 @@ def read_spikes_from_file(
     return numpy.array(data)
 
 
+@lru_cache(maxsize=256)
 def get_probable_maximum_selected(
         n_total_trials, n_trials, selection_prob, chance=(1.0 / 100.0)):
     """
     Get the likely maximum number of items that will be selected from a
     set of `n_trials` from a total set of `n_total_trials`
     with a probability of selection of `selection_prob`.
+
+    .. note::
+        The result is remembered, as the same question is asked for each
+        slice of a projection and the binomial inverse is slow to work out.
     """
     prob = 1.0 - (chance / float(n_total_trials))
     val = binom.ppf(prob, n_trials, selection_prob)
@@ -367,14 +400,15 @@ def _validate_mars_kiss_64_seed(seed: List[int]) -> List[int]:
     return seed
 
 
-def create_mars_kiss_seeds(rng) -> Tuple[int, ...]:
+def create_mars_kiss_seeds(
+        rng: Union[RandomState, Generator]) -> Tuple[int, ...]:
     """
     Generates and checks that the seed values generated by the given
     random number generator or seed to a random number generator are
     suitable for use as a mars 64 kiss seed.
 
     :param rng: the random number generator.
-    :type rng: ~numpy.random.RandomState
+    :type rng: ~numpy.random.RandomState or ~numpy.random.Generator
     :param seed:
         the seed to create a random number generator if not handed.
     :type seed: int or None
@@ -382,8 +416,9 @@ def create_mars_kiss_seeds(rng) -> Tuple[int, ...]:
         number generator for seeds.
     :rtype: list(int)
     """
+    randint = rng.integers if isinstance(rng, Generator) else rng.randint
     kiss_seed = _validate_mars_kiss_64_seed([
-        rng.randint(-BASE_RANDOM_FOR_MARS_64, CAP_RANDOM_FOR_MARS_64) +
+        int(randint(-BASE_RANDOM_FOR_MARS_64, CAP_RANDOM_FOR_MARS_64)) +
         BASE_RANDOM_FOR_MARS_64 for _ in range(N_RANDOM_NUMBERS)])
     return tuple(kiss_seed)
 
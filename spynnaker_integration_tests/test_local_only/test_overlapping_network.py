@@ -109,8 +109,8 @@ def do_run():
     dev = p.Population(None, spif_dev)
 
     # Make a kernel and convolution connector
-    k_shape = numpy.array([5, 5], dtype='int32')
-    k_size = numpy.prod(k_shape)
+    k_shape = (5, 5)
+    k_size = k_shape[0] * k_shape[1]
     kernel = (numpy.arange(k_size) - (k_size / 2)).reshape(k_shape) * 0.1
     conn = p.ConvolutionConnector(kernel)
 
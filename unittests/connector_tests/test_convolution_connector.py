@@ -0,0 +1,120 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from pacman.model.graphs.common import MDSlice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    ConvolutionConnector)
+
+
+class _MockSplitter(object):
+    def __init__(self, vertices):
+        self.__vertices = vertices
+
+    def get_out_going_vertices(self, partition_id):
+        return self.__vertices
+
+    def get_in_coming_vertices(self, partition_id):
+        return self.__vertices
+
+
+class _MockMachineVertex(object):
+    def __init__(self, vertex_slice):
+        self.vertex_slice = vertex_slice
+
+
+class _MockAppVertex(object):
+    def __init__(self, shape, sub_shape):
+        vertices = list()
+        lo_atom = 0
+        for y in range(0, shape[1], sub_shape[1]):
+            for x in range(0, shape[0], sub_shape[0]):
+                width = min(sub_shape[0], shape[0] - x)
+                height = min(sub_shape[1], shape[1] - y)
+                n_atoms = width * height
+                vertices.append(_MockMachineVertex(MDSlice(
+                    lo_atom, lo_atom + n_atoms - 1, (width, height), (x, y),
+                    shape)))
+                lo_atom += n_atoms
+        self.atoms_shape = shape
+        self.splitter = _MockSplitter(vertices)
+
+
+class _MockSynapseInfo(object):
+    partition_id = "SPIKE"
+
+
+def _expected_pre(vertex, pre_vertices, kernel, pool_stride, strides,
+                  padding):
+    """ Work out the connected pre-vertices one at a time with plain
+        Python floor division
+    """
+    post_slice_x = vertex.vertex_slice.get_slice(0)
+    post_slice_y = vertex.vertex_slice.get_slice(1)
+    min_x = post_slice_x.start - (kernel[0] // 2)
+    max_x = post_slice_x.stop - 1 + (kernel[0] // 2)
+    min_y = post_slice_y.start - (kernel[1] // 2)
+    max_y = post_slice_y.stop - 1 + (kernel[1] // 2)
+
+    def as_post(value, axis):
+        return (((value // pool_stride[axis]) - (kernel[axis] // 2) +
+                 padding[axis]) // strides[axis])
+
+    expected = list()
+    for pre in pre_vertices:
+        pre_x = pre.vertex_slice.get_slice(0)
+        pre_y = pre.vertex_slice.get_slice(1)
+        if (as_post(pre_x.start, 0) <= max_x and
+                as_post(pre_y.start, 1) <= max_y and
+                as_post(pre_x.stop - 1, 0) >= min_x and
+                as_post(pre_y.stop - 1, 1) >= min_y):
+            expected.append(pre)
+    return expected
+
+
+@pytest.mark.parametrize(
+    "kernel, strides, pool_shape, padding", [
+        ((3, 3), None, None, None),
+        ((5, 5), 2, None, None),
+        ((5, 3), (2, 4), None, 1),
+        ((5, 5), 3, None, (2, 1)),
+        ((3, 3), None, 2, None),
+        ((3, 5), 2, (3, 2), 1),
+        ((7, 7), (1, 2), 4, None)
+    ])
+def test_connected_vertices(kernel, strides, pool_shape, padding):
+    unittest_setup()
+    connector = ConvolutionConnector(
+        1.0, kernel_shape=kernel, strides=strides, pool_shape=pool_shape,
+        padding=padding)
+    pre_shape = (48, 40)
+    pre = _MockAppVertex(pre_shape, (8, 5))
+    post = _MockAppVertex(connector.get_post_shape(pre_shape), (3, 4))
+
+    def to_2d(value, default):
+        if value is None:
+            return default
+        if isinstance(value, int):
+            return (value, value)
+        return value
+
+    pre_vertices = pre.splitter.get_out_going_vertices(None)
+    connected = connector.get_connected_vertices(
+        _MockSynapseInfo(), pre, post)
+    assert len(connected) == len(post.splitter.get_in_coming_vertices(None))
+    for post_vertex, pre_connected in connected:
+        assert pre_connected == _expected_pre(
+            post_vertex, pre_vertices, kernel, to_2d(pool_shape, (1, 1)),
+            to_2d(strides, (1, 1)), to_2d(padding, (0, 0)))
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from pyNN.random import NumpyRNG
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedNumberPostConnector)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    fixed_number_post_connector as fnp)
+from unittests.mocks import MockPopulation
+
+
+@pytest.mark.parametrize(
+    "n, with_replacement, allow_self_connections", [
+        (1, False, True),
+        (7, False, True),
+        (7, False, False),
+        (19, False, False),
+        (7, True, True),
+        (30, True, False)
+    ])
+def test_host_connections(n, with_replacement, allow_self_connections):
+    unittest_setup()
+    n_neurons = 20
+    pop = MockPopulation(n_neurons, "Pop")
+    connector = FixedNumberPostConnector(
+        n, with_replacement=with_replacement,
+        allow_self_connections=allow_self_connections, rng=NumpyRNG(42))
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=pop, post_population=pop,
+        prepop_is_view=False, postpop_is_view=False,
+        synapse_dynamics=None, synapse_type=None, receptor_type=None,
+        synapse_type_from_dynamics=False, weights=1.5, delays=1.0)
+    connector.set_projection_information(synapse_info)
+
+    post_slices = [Slice(0, 7), Slice(8, 15), Slice(16, n_neurons - 1)]
+    targets = [list() for _ in range(n_neurons)]
+    for post_slice in post_slices:
+        block = connector.create_synaptic_block(
+            post_slices, post_slice, 0, synapse_info)
+        assert numpy.all(block["target"] >= post_slice.lo_atom)
+        assert numpy.all(block["target"] <= post_slice.hi_atom)
+        for source, target in zip(block["source"], block["target"]):
+            targets[source].append(target)
+
+    # Every pre-neuron connects to exactly n post-neurons
+    for pre_neuron, post_neurons in enumerate(targets):
+        assert len(post_neurons) == n
+        if not with_replacement:
+            assert len(set(post_neurons)) == n
+        if not allow_self_connections:
+            assert pre_neuron not in post_neurons
+
+
+def _dense_post_neurons(n_threads, seed):
+    pop = MockPopulation(20, "Pop")
+    # With 7 of 20 chosen without replacement the keys are used
+    connector = FixedNumberPostConnector(
+        7, allow_self_connections=False, rng=NumpyRNG(seed))
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=pop, post_population=pop,
+        prepop_is_view=False, postpop_is_view=False,
+        synapse_dynamics=None, synapse_type=None, receptor_type=None,
+        synapse_type_from_dynamics=False, weights=1.5, delays=1.0)
+    connector.set_projection_information(synapse_info)
+    with pytest.MonkeyPatch.context() as patch:
+        # Force 3 rows per block, so 7 blocks, in the given threads
+        patch.setattr(fnp, "_MAX_KEYS", 60)
+        patch.setattr(fnp, "_MAX_THREADS", n_threads)
+        patch.setattr(fnp.os, "cpu_count", lambda: n_threads)
+        # pylint: disable=protected-access
+        return connector._get_post_neurons(synapse_info)
+
+
+def test_dense_blocks():
+    unittest_setup()
+    post_neurons = _dense_post_neurons(4, 42)
+    assert post_neurons.shape == (20, 7)
+    for pre_neuron, row in enumerate(post_neurons):
+        assert len(set(row.tolist())) == 7
+        assert pre_neuron not in row
+        assert numpy.all((0 <= row) & (row < 20))
+
+    # The same seed gives the same choices, whatever the number of threads
+    assert numpy.array_equal(post_neurons, _dense_post_neurons(4, 42))
+    assert numpy.array_equal(post_neurons, _dense_post_neurons(1, 42))
+    assert not numpy.array_equal(post_neurons, _dense_post_neurons(4, 43))
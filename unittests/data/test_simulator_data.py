@@ -25,7 +25,9 @@ from spynnaker.pyNN.models.neural_projections.connectors import (
 from spynnaker.pyNN.models.neuron.builds import IFCurrExpBase
 from spynnaker.pyNN.models.projection import Projection
 from spynnaker.pyNN.models.populations.population import Population
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
 import pyNN.spiNNaker as sim
+from spynnaker.pyNN import NativeRNG
 
 
 class TestSimulatorData(unittest.TestCase):
@@ -139,6 +141,29 @@ class TestSimulatorData(unittest.TestCase):
         with self.assertRaises(TypeError):
             writer.add_projection("bacon")
 
+    def test_projection_edges(self):
+        writer = SpynnakerDataWriter.setup()
+        writer.set_up_timings_and_delay(1000, 1, 1)
+        model = IFCurrExpBase()
+        pop_1 = Population(size=5, cellclass=model)
+        pop_2 = Population(size=5, cellclass=model)
+        # pylint: disable=protected-access
+        self.assertIsNone(SpynnakerDataView.get_projection_edge(
+            pop_1._vertex, pop_2._vertex, SPIKE_PARTITION_ID))
+        pro_1 = Projection(
+            pop_1, pop_2, OneToOneConnector(), receptor_type='excitatory')
+        pro_2 = Projection(
+            pop_1, pop_2, OneToOneConnector(), receptor_type='inhibitory')
+        pro_3 = Projection(
+            pop_2, pop_1, OneToOneConnector(), receptor_type='excitatory')
+        self.assertIs(pro_1._projection_edge, pro_2._projection_edge)
+        self.assertIsNot(pro_1._projection_edge, pro_3._projection_edge)
+        self.assertIs(pro_1._projection_edge,
+                      SpynnakerDataView.get_projection_edge(
+                          pop_1._vertex, pop_2._vertex, SPIKE_PARTITION_ID))
+        self.assertIsNone(SpynnakerDataView.get_projection_edge(
+            pop_1._vertex, pop_2._vertex, "bacon"))
+
     def test_segment_counter(self):
         writer = SpynnakerDataWriter.setup()
         self.assertEqual(0, SpynnakerDataView.get_segment_counter())
@@ -194,3 +219,14 @@ class TestSimulatorData(unittest.TestCase):
     def test_sim_name(self):
         self.assertEqual(SpynnakerDataView.get_sim_name(), sim.name())
         self.assertIn("sPyNNaker", SpynnakerDataView.get_sim_name())
+
+    def test_rng(self):
+        rng = SpynnakerDataView.get_rng()
+        self.assertIs(rng, SpynnakerDataView.get_rng())
+        NativeRNG(42)
+        first = SpynnakerDataView.get_rng().random(5)
+        # The seed survives setup
+        NativeRNG(42)
+        SpynnakerDataWriter.setup()
+        self.assertEqual(
+            list(first), list(SpynnakerDataView.get_rng().random(5)))
@@ -0,0 +1,304 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import ceil
+from unittest.mock import patch
+import numpy
+import pytest
+from pacman.model.graphs.common import MDSlice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.common.local_only_2d_common import (
+    BITS_PER_SHORT, N_COLOUR_BITS_BITS, Source, get_div_const)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    PoolDenseConnector)
+from spynnaker.pyNN.models.neuron.local_only import (
+    local_only_pool_dense, LocalOnlyPoolDense)
+
+
+class _Connector(PoolDenseConnector):
+    """
+    A connector that writes some recognisable words of its own.
+    """
+
+    def __init__(self, first_word):
+        # pylint: disable=super-init-not-called
+        self.first_word = first_word
+
+    def get_local_only_data(self, app_edge, local_delay, delay_stage,
+                            post_vertex_slice, weight_scales):
+        return numpy.arange(
+            self.first_word, self.first_word + 3 + local_delay,
+            dtype=numpy.uint32)
+
+    def local_only_n_bytes(self, pre_shape, n_post_atoms):
+        return 4 * len(pre_shape)
+
+
+class _Thing(object):
+    """
+    A bag of attributes standing in for graph objects.
+    """
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class _Spec(object):
+    """
+    A data specification that remembers the words written.
+    """
+
+    def __init__(self):
+        self.words = list()
+
+    def reserve_memory_region(self, region, size, label):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, value, data_type):
+        self.words.append(int(value))
+
+    def write_array(self, array):
+        self.words.extend(numpy.asarray(array, dtype=numpy.uint32).tolist())
+
+
+def _slice(shape, atoms_shape):
+    return MDSlice(0, int(numpy.prod(shape)) - 1, shape,
+                   tuple(0 for _ in shape), atoms_shape)
+
+
+def _first_and_last_slice(pre_vertex):
+    last_shape = tuple(
+        (size % core) or core
+        for size, core in zip(pre_vertex.atoms_shape, pre_vertex.core_shape))
+    return (_slice(pre_vertex.core_shape, pre_vertex.atoms_shape),
+            _slice(last_shape, pre_vertex.atoms_shape))
+
+
+def _rinfo(pre_vertex, part_id):
+    return (_Thing(key=pre_vertex.key, mask=0xFFFF0000),
+            len(pre_vertex.atoms_shape) * 3, len(pre_vertex.core_shape) + 4)
+
+
+def _old_source_data(sources):
+    """
+    Get the source words in the way they were worked out before they were
+    cached.
+    """
+    source_data = list()
+    first_conn_index = 0
+    for (pre_vertex, part_id), source_infos in sources.items():
+        r_info, core_mask, mask_shift = _rinfo(pre_vertex, part_id)
+        first_slice, last_slice = _first_and_last_slice(pre_vertex)
+        n_dims = len(pre_vertex.atoms_shape)
+        source_data.extend([r_info.key, r_info.mask])
+        source_data.append(
+            (len(source_infos) << BITS_PER_SHORT) +
+            (pre_vertex.n_colour_bits <<
+             (BITS_PER_SHORT - N_COLOUR_BITS_BITS)) +
+            first_conn_index)
+        source_data.append((mask_shift << BITS_PER_SHORT) + core_mask)
+        source_data.append(n_dims)
+        cum_size = 1
+        cum_cores_per_dim = 1
+        cum_last_size = 1
+        all_dim_data = list()
+        for i in range(n_dims):
+            cores_per_dim = int(ceil(
+                pre_vertex.atoms_shape[i] / first_slice.shape[i]))
+            all_dim_data.append([
+                first_slice.shape[i], cum_size, get_div_const(cum_size),
+                cores_per_dim, cum_cores_per_dim,
+                get_div_const(cum_cores_per_dim),
+                last_slice.shape[i], cum_last_size,
+                get_div_const(cum_last_size)])
+            cum_size *= first_slice.shape[i]
+            cum_cores_per_dim *= cores_per_dim
+            cum_last_size *= last_slice.shape[i]
+        for dim_data in reversed(all_dim_data):
+            source_data.extend(dim_data)
+        first_conn_index += len(source_infos)
+    return source_data
+
+
+def _make_sources(pre_vertices, n_connectors):
+    """
+    Make the sources of a target, with n_connectors projections from each
+    of the pre_vertices.
+    """
+    sources = dict()
+    projections = list()
+    for i, pre_vertex in enumerate(pre_vertices):
+        edge = _Thing(pre_vertex=pre_vertex)
+        source_infos = list()
+        for j in range(n_connectors):
+            projection = _Thing(
+                _synapse_information=_Thing(
+                    connector=_Connector(100 * i + 10 * j)),
+                _projection_edge=edge)
+            projections.append(projection)
+            source_infos.append(Source(projection, j % 2, i % 2))
+        sources[pre_vertex, "SPIKE"] = source_infos
+    return sources, projections
+
+
+def _write(dynamics, sources, projections):
+    machine_vertex = _Thing(
+        app_vertex=_Thing(incoming_projections=projections),
+        vertex_slice=_slice((3, 4), (9, 8)))
+    spec = _Spec()
+    with patch.object(local_only_pool_dense, "get_sources_for_target",
+                      return_value=sources), \
+            patch.object(local_only_pool_dense, "get_rinfo_for_spike_source",
+                         side_effect=_rinfo), \
+            patch.object(local_only_pool_dense, "get_first_and_last_slice",
+                         side_effect=_first_and_last_slice):
+        dynamics.write_parameters(
+            spec, 1, machine_vertex, numpy.array([1.0, 2.0]))
+    return spec.words
+
+
+def test_write_parameters_layout():
+    unittest_setup()
+    pre_vertices = [
+        _Thing(atoms_shape=(16, 12), core_shape=(4, 3), n_colour_bits=2,
+               key=0x10000),
+        _Thing(atoms_shape=(10,), core_shape=(4,), n_colour_bits=0,
+               key=0x20000),
+        _Thing(atoms_shape=(9, 8, 5), core_shape=(2, 3, 5), n_colour_bits=7,
+               key=0x30000)]
+    sources, projections = _make_sources(pre_vertices, 3)
+    connector_data = list()
+    for source_infos in sources.values():
+        for source in source_infos:
+            connector = source.projection._synapse_information.connector
+            connector_data.extend(connector.get_local_only_data(
+                None, source.local_delay, None, None, None).tolist())
+    expected = ([12, len(sources), len(projections)] +
+                _old_source_data(sources) + connector_data)
+
+    dynamics = LocalOnlyPoolDense()
+    assert _write(dynamics, sources, projections) == expected
+    # Again, to check that the cached values are the same
+    assert _write(dynamics, sources, projections) == expected
+
+
+def _pre_vertex(n_colour_bits=0, key=0x10000):
+    return _Thing(atoms_shape=(10,), core_shape=(4,),
+                  n_colour_bits=n_colour_bits, key=key)
+
+
+def test_too_many_connectors_from_source():
+    unittest_setup()
+    sources, projections = _make_sources(
+        [_pre_vertex()], 1 << BITS_PER_SHORT)
+    with pytest.raises(SynapticConfigurationException,
+                       match="from source"):
+        _write(LocalOnlyPoolDense(), sources, projections)
+
+
+def test_too_many_connectors_before_source():
+    unittest_setup()
+    # Enough connectors from the first source that the second starts at an
+    # index that doesn't fit
+    n_connectors = 1 << (BITS_PER_SHORT - N_COLOUR_BITS_BITS)
+    sources, projections = _make_sources(
+        [_pre_vertex(key=0x10000), _pre_vertex(key=0x20000)], n_connectors)
+    with pytest.raises(SynapticConfigurationException,
+                       match="before source"):
+        _write(LocalOnlyPoolDense(), sources, projections)
+
+    # One fewer is fine
+    sources, projections = _make_sources(
+        [_pre_vertex(key=0x10000), _pre_vertex(key=0x20000)],
+        n_connectors - 1)
+    _write(LocalOnlyPoolDense(), sources, projections)
+
+
+def test_too_many_colour_bits():
+    unittest_setup()
+    sources, projections = _make_sources(
+        [_pre_vertex(n_colour_bits=1 << N_COLOUR_BITS_BITS)], 1)
+    with pytest.raises(SynapticConfigurationException,
+                       match="colour bits"):
+        _write(LocalOnlyPoolDense(), sources, projections)
+
+    sources, projections = _make_sources(
+        [_pre_vertex(n_colour_bits=(1 << N_COLOUR_BITS_BITS) - 1)], 1)
+    _write(LocalOnlyPoolDense(), sources, projections)
+
+
+class _CountingConnector(PoolDenseConnector):
+    """
+    A connector that counts how often its weights are read.
+    """
+
+    def __init__(self, weights):
+        super().__init__(weights)
+        self.n_reads = 0
+
+    @property
+    def weights(self):
+        self.n_reads += 1
+        return super().weights
+
+
+def _old_weight_stats(weights):
+    """
+    Get the weight statistics in the way they were worked out before they
+    were cached.
+    """
+    pos_weights = weights[weights > 0]
+    neg_weights = weights[weights < 0]
+    max_weight = numpy.amax(weights)
+    min_weight = numpy.amin(weights)
+    return (
+        max_weight if max_weight > 0 else 0,
+        min_weight if min_weight < 0 else 0,
+        numpy.mean(pos_weights) if len(pos_weights) else 0,
+        numpy.mean(neg_weights) if len(neg_weights) else 0,
+        numpy.var(pos_weights) if len(pos_weights) else 0,
+        numpy.var(neg_weights) if len(neg_weights) else 0)
+
+
+def _weight_stats(dynamics, projection):
+    return (dynamics.get_maximum_positive_weight(projection),
+            dynamics.get_minimum_negative_weight(projection),
+            dynamics.get_mean_positive_weight(projection),
+            dynamics.get_mean_negative_weight(projection),
+            dynamics.get_variance_positive_weight(projection),
+            dynamics.get_variance_negative_weight(projection))
+
+
+@pytest.mark.parametrize("weights", [
+    [[1.5, -2.0, 0.0], [3.0, -0.5, 2.5]],
+    [[0.25, 1.0], [4.0, 2.0]],
+    [[-0.25, -1.0], [-4.0, -2.0]],
+    [[3.5]],
+    [[-3.5]]])
+def test_weight_stats(weights):
+    unittest_setup()
+    connector = _CountingConnector(weights)
+    projection = _Thing(_synapse_information=_Thing(connector=connector))
+    dynamics = LocalOnlyPoolDense()
+    expected = _old_weight_stats(numpy.array(weights))
+    assert numpy.allclose(_weight_stats(dynamics, projection), expected)
+
+    # The second time they all come from the cache
+    n_reads = connector.n_reads
+    assert numpy.allclose(_weight_stats(dynamics, projection), expected)
+    assert connector.n_reads == n_reads
@@ -105,3 +105,12 @@ class TestSpikeSourceArrayVertex(unittest.TestCase):
                     self.assertIn("109", msg)
                     found = True
             self.assertTrue(found)
+
+    def test_double_list_no_spikes(self):
+        with LogCapture() as lc:
+            SpikeSourceArrayVertex(
+                n_neurons=2, spike_times=[[], []],
+                label="test", max_atoms_per_core=None, model=None,
+                splitter=None, n_colour_bits=None)
+            for record in lc.records:
+                self.assertNotIn("too many spikes", str(record.msg))
@@ -0,0 +1,47 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import numpy
+import pyNN.spiNNaker as sim
+
+
+class _Cell(object):
+    def __init__(self, position):
+        self.position = numpy.array(position, dtype=float)
+
+
+class TestDistance(unittest.TestCase):
+
+    def test_single(self):
+        d = sim.distance(_Cell([0, 0, 0]), _Cell([3, 4, 0]))
+        self.assertAlmostEqual(5.0, d)
+
+    def test_many(self):
+        src = numpy.array([[0, 0, 0], [1, 1, 1]])
+        tgt = numpy.array([[3, 4, 0], [1, 1, 1], [0, 0, 2]])
+        d = sim.distance(src, tgt)
+        self.assertEqual((2, 3), d.shape)
+        for i, s in enumerate(src):
+            for j, t in enumerate(tgt):
+                self.assertAlmostEqual(
+                    sim.distance(_Cell(s), _Cell(t)), d[i, j])
+
+    def test_cells_with_mask(self):
+        src = [_Cell([0, 0, 5]), _Cell([1, 1, 1])]
+        d = sim.distance(src, _Cell([3, 4, 0]), mask=numpy.array([0, 1]))
+        self.assertTrue(numpy.allclose([5.0, numpy.sqrt(13.0)], d))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,3 +26,8 @@ class TestListStandardModules(unittest.TestCase):
         self.assertIn('Izhikevich', results)
         self.assertIn('SpikeSourceArray', results)
         self.assertIn('SpikeSourcePoisson', results)
+
+    def test_check_list_is_copy(self):
+        results = sim.list_standard_models()
+        results.append("NotAModel")
+        self.assertNotIn("NotAModel", sim.list_standard_models())
@@ -0,0 +1,194 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import ceil
+import pytest
+from pacman.model.graphs.machine import MachineFPGAVertex
+from pacman.utilities.constants import BITS_IN_KEY
+from spinn_front_end_common.utility_models import MultiCastCommand
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models.spif_devices import (
+    SPIFRegister, SpiNNFPGARegister, N_FIELDS, N_FILTERS, N_INPUTS,
+    set_mapper_key, set_field_mask, set_field_shift, set_field_limit,
+    set_filter_value, set_filter_mask, set_input_key, set_input_mask,
+    set_input_route, set_distiller_key, set_distiller_mask,
+    set_distiller_shift, set_xp_key, set_xp_mask,
+    _command, _LC_KEY, _RC_KEY, _REPEATS, _DELAY_BETWEEN_REPEATS)
+from spynnaker.pyNN.external_devices_models.spif_retina_device import (
+    SPIFRetinaDevice)
+
+#: The retina sizes (width, height, sub_width, sub_height) to test
+_SIZES = [(64, 32, 8, 4), (128, 100, 16, 8), (32, 32, 4, 2),
+          (256, 128, 32, 32)]
+
+#: The base keys to test
+_BASE_KEYS = [0, 1, 5]
+
+
+def _fields(command):
+    return (command.key, command.payload, command.time, command.repeat,
+            command.delay_between_repeats)
+
+
+def _old_cmd(key_base, register, payload=None, index=0):
+    """
+    Make a register command in the way it was made before the keys of the
+    registers were worked out once.
+    """
+    return MultiCastCommand(
+        key_base + register.value + index, payload, time=None,
+        repeat=_REPEATS, delay_between_repeats=_DELAY_BETWEEN_REPEATS)
+
+
+def _old_fpga_indices(fpga_link_id):
+    fpga_index = (fpga_link_id - 1) // 2
+    return (fpga_index % SPIFRetinaDevice.X_PER_ROW,
+            fpga_index // SPIFRetinaDevice.X_PER_ROW)
+
+
+def _old_spif_mask(device):
+    n_key_bits = BITS_IN_KEY - device._key_shift
+    key_mask = (1 << n_key_bits) - 1
+    return ((key_mask << device._key_shift) +
+            (SPIFRetinaDevice.Y_MASK << device._source_y_shift) +
+            (SPIFRetinaDevice.X_MASK << device._source_x_shift))
+
+
+def _old_spif_key(device, base_key, fpga_link_id):
+    x, y = _old_fpga_indices(fpga_link_id)
+    return ((base_key << device._key_shift) +
+            (x << device._source_x_shift) +
+            (y << device._source_y_shift))
+
+
+def test_command():
+    unittest_setup()
+    for key in [0, 1, _RC_KEY + 5, 0xFFFFFFFF]:
+        for payload in [None, 0, 17, 0xFFFFFFFF]:
+            assert _fields(_command(key, payload)) == _fields(
+                MultiCastCommand(
+                    key, payload, time=None, repeat=_REPEATS,
+                    delay_between_repeats=_DELAY_BETWEEN_REPEATS))
+
+
+def test_register_commands():
+    unittest_setup()
+    for register in SPIFRegister:
+        assert _fields(register.cmd(12, 3)) == _fields(
+            _old_cmd(_RC_KEY, register, 12, 3))
+    for register in SpiNNFPGARegister:
+        assert _fields(register.cmd()) == _fields(
+            _old_cmd(_LC_KEY, register))
+    for pipe in range(2):
+        assert _fields(set_mapper_key(pipe, 0x1234)) == _fields(
+            _old_cmd(_RC_KEY, SPIFRegister.MP_KEY_BASE, 0x1234, pipe))
+        for index in range(N_FIELDS):
+            field = (pipe * N_FIELDS) + index
+            assert _fields(set_field_mask(pipe, index, 7)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.MP_FLD_MASK_BASE, 7, field))
+            assert _fields(set_field_shift(pipe, index, 3)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.MP_FLD_SHIFT_BASE, 3, field))
+            assert _fields(set_field_limit(pipe, index, 9)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.MP_FLD_LIMIT_BASE, 9, field))
+        for index in range(N_FILTERS):
+            fil = (pipe * N_FILTERS) + index
+            assert _fields(set_filter_value(pipe, index, 1)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.FL_VALUE_BASE, 1, fil))
+            assert _fields(set_filter_mask(pipe, index, 0)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.FL_MASK_BASE, 0, fil))
+        for index in range(N_INPUTS):
+            inp = (pipe * N_INPUTS) + index
+            assert _fields(set_input_key(pipe, index, 0x30000)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.IR_KEY_BASE, 0x30000, inp))
+            assert _fields(set_input_mask(pipe, index, 0xFF0)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.IR_MASK_BASE, 0xFF0, inp))
+            assert _fields(set_input_route(pipe, index, index)) == _fields(
+                _old_cmd(_RC_KEY, SPIFRegister.IR_ROUTE_BASE, index, inp))
+    for index in range(4):
+        assert _fields(set_distiller_key(index, 0x50)) == _fields(
+            _old_cmd(_RC_KEY, SPIFRegister.DIST_KEY_BASE, 0x50, index))
+        assert _fields(set_distiller_mask(index, 0xF0)) == _fields(
+            _old_cmd(_RC_KEY, SPIFRegister.DIST_MASK_BASE, 0xF0, index))
+        assert _fields(set_distiller_shift(index, 2)) == _fields(
+            _old_cmd(_RC_KEY, SPIFRegister.DIST_SHIFT_BASE, 2, index))
+        assert _fields(set_xp_key(index, 0x60)) == _fields(
+            _old_cmd(_LC_KEY, SpiNNFPGARegister.XP_KEY_BASE, 0x60, index))
+        assert _fields(set_xp_mask(index, 0xF8)) == _fields(
+            _old_cmd(_LC_KEY, SpiNNFPGARegister.XP_MASK_BASE, 0xF8, index))
+
+
+@pytest.mark.parametrize("base_key", _BASE_KEYS)
+@pytest.mark.parametrize("width, height, sub_width, sub_height", _SIZES)
+def test_sub_squares_and_keys(width, height, sub_width, sub_height, base_key):
+    unittest_setup()
+    device = SPIFRetinaDevice(
+        1, width, height, sub_width, sub_height, base_key=base_key)
+    n_squares_per_row = int(ceil(width / sub_width))
+    spif_mask = _old_spif_mask(device)
+    for index in range(device._n_sub_rectangles):
+        x_index = index % n_squares_per_row
+        y_index = index // n_squares_per_row
+        assert device._sub_square_from_index(index) == (x_index, y_index)
+
+        key = ((base_key << device._key_shift) +
+               (y_index << device._y_index_shift) +
+               (x_index << device._x_index_shift))
+        for link in device.incoming_fpga_connections:
+            machine_vertex = MachineFPGAVertex(
+                link.fpga_id, link.fpga_link_id, link.board_address,
+                link.chip_coords, app_vertex=device,
+                vertex_slice=device.get_incoming_slice_for_link(link, index))
+            fpga_x, fpga_y = _old_fpga_indices(link.fpga_link_id)
+            fpga_key = key + (
+                (fpga_y << device._source_y_shift) +
+                (fpga_x << device._source_x_shift))
+            fpga_mask = device._mask | spif_mask
+            # Twice, so that the cached values are checked too
+            for _ in range(2):
+                key_and_mask = device.get_machine_fixed_key_and_mask(
+                    machine_vertex, "SPIKE")
+                assert key_and_mask.key == fpga_key
+                assert key_and_mask.mask == fpga_mask
+
+
+@pytest.mark.parametrize("base_key", _BASE_KEYS)
+@pytest.mark.parametrize("width, height, sub_width, sub_height", _SIZES)
+def test_start_stop_commands(
+        width, height, sub_width, sub_height, base_key):
+    unittest_setup()
+    pipe = 1
+    device = SPIFRetinaDevice(
+        pipe, width, height, sub_width, sub_height, base_key=base_key)
+    spif_mask = _old_spif_mask(device)
+    expected = [_old_cmd(
+        _RC_KEY, SPIFRegister.MP_KEY_BASE, base_key << device._key_shift,
+        pipe)]
+    for i in range(8):
+        input_index = (pipe * N_INPUTS) + i
+        expected.append(_old_cmd(
+            _RC_KEY, SPIFRegister.IR_KEY_BASE,
+            _old_spif_key(device, base_key, 15 - (i * 2)), input_index))
+        expected.append(_old_cmd(
+            _RC_KEY, SPIFRegister.IR_MASK_BASE, spif_mask, input_index))
+        expected.append(_old_cmd(
+            _RC_KEY, SPIFRegister.IR_ROUTE_BASE, i, input_index))
+
+    commands = [_fields(command) for command in device.start_resume_commands]
+    assert commands[0] == _fields(_old_cmd(_LC_KEY, SpiNNFPGARegister.STOP))
+    assert commands[-1] == _fields(
+        _old_cmd(_LC_KEY, SpiNNFPGARegister.START))
+    for command in expected:
+        assert _fields(command) in commands
+    assert [_fields(command) for command in device.pause_stop_commands] == [
+        _fields(_old_cmd(_LC_KEY, SpiNNFPGARegister.STOP))]
@@ -15,7 +15,9 @@
 import os
 import shutil
 import unittest
+import numpy
 from pyNN.random import RandomDistribution
+from spinn_front_end_common.interface.ds import DataType
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.utilities import utility_calls
 
@@ -56,6 +58,28 @@ class TestUtilityCalls(unittest.TestCase):
         self.assertTrue(hasattr(multi_value, "__iter__"))
         self.assertEqual(len(multi_value), 10)
 
+    def test_convert_all_to(self):
+        values = numpy.random.default_rng(1).uniform(-0.9, 0.9, 100)
+        for data_type in (DataType.S1615, DataType.S031, DataType.INT16,
+                          DataType.UINT8, DataType.FLOAT_32):
+            converted = utility_calls.convert_all_to(values, data_type)
+            self.assertEqual(converted.dtype, data_type.struct_encoding)
+            self.assertEqual(
+                converted.tolist(),
+                [utility_calls.convert_to(v, data_type) for v in values])
+
+    def test_create_mars_kiss_seeds(self):
+        for rng in (numpy.random.RandomState(3),
+                    numpy.random.default_rng(3)):
+            seeds = utility_calls.create_mars_kiss_seeds(rng)
+            self.assertEqual(len(seeds), 4)
+            for seed in seeds:
+                self.assertIsInstance(seed, int)
+                self.assertTrue(0 <= seed <= 0xFFFFFFFF)
+        self.assertEqual(
+            utility_calls.create_mars_kiss_seeds(numpy.random.default_rng(3)),
+            utility_calls.create_mars_kiss_seeds(numpy.random.default_rng(3)))
+
 
 if __name__ == '__main__':
     unittest.main()